@@ -9,12 +9,15 @@ from __future__ import annotations
 
 import logging
 import os
-from typing import Callable, Dict, Iterable, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Optional, Union
 
 import numpy as np
 import pandas as pd
+from pandas.api.indexers import VariableOffsetWindowIndexer
+from pandas.api.types import is_datetime64_any_dtype
 from pandas.tseries.offsets import DateOffset
-from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
 
 import python_logging_framework as plog
 from constants import TRANSACTION_AMOUNT_LABEL
@@ -23,25 +26,76 @@ from helpers import prepare_future_dates, write_predictions
 TEST_MAE_COLUMN = "Test MAE"
 TEST_RMSE_COLUMN = "Test RMSE"
 
+ArrayLike = Union[pd.Series, np.ndarray]
+
+# Shared so pandas' numba kernel cache is hit for every rolling window.
+_NUMBA_ENGINE_KWARGS = {"nopython": True, "nogil": True, "parallel": False}
+
+
+def _to_datetime_index(dates: pd.Series) -> pd.DatetimeIndex:
+    """Return dates as a DatetimeIndex, parsing only when they are not already datetime64."""
+    if is_datetime64_any_dtype(dates):
+        return pd.DatetimeIndex(dates)
+    return pd.DatetimeIndex(pd.to_datetime(dates, cache=True))
+
+
+@lru_cache(maxsize=None)
+def _month_offset(months: int) -> DateOffset:
+    """Return a shared DateOffset of the given number of months."""
+    return DateOffset(months=months)
+
+
+@lru_cache(maxsize=None)
+def _year_offset(years: int) -> DateOffset:
+    """Return a shared DateOffset of the given number of years."""
+    return DateOffset(years=years)
+
 
 def _ensure_series_with_dates(series: pd.Series, dates: pd.Series) -> pd.Series:
-    """Return a series indexed by dates for time-based baselines."""
+    """
+    Return a series indexed by dates for time-based baselines.
+
+    The result is sorted by date so downstream baselines can rely on
+    searchsorted and positional slices instead of boolean date masks.
+    """
     if len(series) != len(dates):
         raise ValueError("Series length must match dates length for baseline evaluation.")
-    return pd.Series(series.values, index=pd.to_datetime(dates), name=TRANSACTION_AMOUNT_LABEL)
+    result = pd.Series(series.values, index=_to_datetime_index(dates), name=TRANSACTION_AMOUNT_LABEL)
+    if not result.index.is_monotonic_increasing:
+        result = result.sort_index(kind="stable")
+    return result
+
 
+def _filter_valid(y_true: ArrayLike, y_pred: ArrayLike) -> Optional[Dict[str, float]]:
+    """
+    Filter NaNs and calculate metrics. Returns None when no valid samples.
 
-def _filter_valid(y_true: pd.Series, y_pred: pd.Series) -> Optional[Dict[str, float]]:
-    """Filter NaNs and calculate metrics. Returns None when no valid samples."""
-    mask = ~(y_true.isna() | y_pred.isna())
-    if mask.sum() == 0:
+    RMSE, MAE, and R² are computed from a single residual array. R² follows
+    scikit-learn's ``r2_score`` convention for a constant target (1.0 for a
+    perfect fit, otherwise 0.0).
+    """
+    actual = np.asarray(y_true, dtype=np.float64)
+    predicted = np.asarray(y_pred, dtype=np.float64)
+    mask = ~(np.isnan(actual) | np.isnan(predicted))
+    n_valid = int(mask.sum())
+    if n_valid == 0:
         return None
-    y_true_valid = y_true[mask]
-    y_pred_valid = y_pred[mask]
-    r2_value = np.nan if mask.sum() < 2 else r2_score(y_true_valid, y_pred_valid)
+    actual = actual[mask]
+    residuals = actual - predicted[mask]
+    ss_res = float(residuals @ residuals)
+
+    r2_value = np.nan
+    if n_valid >= 2:
+        centered = actual - actual.mean()
+        ss_tot = float(centered @ centered)
+        if ss_tot != 0:
+            r2_value = 1.0 - ss_res / ss_tot
+        else:
+            r2_value = 1.0 if ss_res == 0 else 0.0
+
     return {
-        "rmse": float(np.sqrt(mean_squared_error(y_true_valid, y_pred_valid))),
-        "mae": float(mean_absolute_error(y_true_valid, y_pred_valid)),
+        "rmse": float(np.sqrt(ss_res / n_valid)),
+        "mae": float(np.abs(residuals).mean()),
         "r2": float(r2_value),
     }
 
@@ -76,26 +130,39 @@ def _log_metrics(logger: logging.Logger, label: str, train_metrics: Optional[Dic
 
 def last_value_predictions(series: pd.Series) -> pd.Series:
     """Predict each point as the previous observed value."""
-    return series.shift(1)
+    values = series.to_numpy(dtype=np.float64)
+    predictions = np.empty_like(values)
+    predictions[:1] = np.nan
+    predictions[1:] = values[:-1]
+    return pd.Series(predictions, index=series.index, name=series.name, copy=False)
 
 
-def rolling_mean_predictions(series: pd.Series, window_months: int) -> pd.Series:
-    """Predict each point using the mean of the previous window_months history."""
-    predictions = []
-    for current_date in series.index:
-        start_date = current_date - DateOffset(months=window_months)
-        history = series.loc[(series.index >= start_date) & (series.index < current_date)]
-        predictions.append(history.mean() if not history.empty else np.nan)
-    return pd.Series(predictions, index=series.index)
+def rolling_mean_predictions(series: pd.Series, window_months: int, engine: str = "cython") -> pd.Series:
+    """
+    Predict each point using the mean of the previous window_months history.
+
+    The window spans calendar months (``[date - window_months, date)``), so a
+    variable-offset indexer is used rather than a fixed day count. The series
+    index must be sorted in ascending order.
+
+    Args:
+        series: Historical series indexed by date.
+        window_months: Window size in calendar months.
+        engine: pandas rolling engine, ``"cython"`` or ``"numba"``.
+
+    Returns:
+        Series of rolling mean predictions aligned with ``series``.
+    """
+    indexer = VariableOffsetWindowIndexer(index=series.index, offset=_month_offset(window_months))
+    engine_kwargs = _NUMBA_ENGINE_KWARGS if engine == "numba" else None
+    predictions = series.rolling(indexer, min_periods=1, closed="left").mean(engine=engine, engine_kwargs=engine_kwargs)
+    return pd.Series(predictions.to_numpy(), index=series.index)
 
 
 def seasonal_naive_predictions(series: pd.Series, years_back: int = 1) -> pd.Series:
     """Predict each point using the value from the same period in previous years."""
-    predictions = []
-    for current_date in series.index:
-        prior_date = current_date - DateOffset(years=years_back)
-        predictions.append(series.get(prior_date, np.nan))
-    return pd.Series(predictions, index=series.index)
+    prior_index = series.index - _year_offset(years_back)
+    return pd.Series(series.reindex(prior_index).to_numpy(), index=series.index)
 
 
 def last_value_forecast(series: pd.Series, forecast_dates: pd.DatetimeIndex) -> np.ndarray:
@@ -105,11 +172,18 @@ def last_value_forecast(series: pd.Series, forecast_dates: pd.DatetimeIndex) ->
 
 
 def rolling_mean_forecast(series: pd.Series, forecast_dates: pd.DatetimeIndex, window_months: int) -> np.ndarray:
-    """Forecast future dates using the rolling mean window up to the latest observed date."""
-    last_date = series.index.max()
-    start_date = last_date - DateOffset(months=window_months)
-    history = series.loc[series.index >= start_date]
-    mean_value = float(history.mean()) if not history.empty else float(series.mean())
+    """
+    Forecast future dates using the rolling mean window up to the latest observed date.
+
+    The series index must be sorted in ascending order; the window start is
+    located with a binary search and the window itself is a positional slice.
+    """
+    if series.empty:
+        return np.full(len(forecast_dates), np.nan)
+    start_date = series.index[-1] - _month_offset(window_months)
+    start = series.index.searchsorted(start_date, side="left")
+    # The window always contains the latest observation, so it is never empty.
+    mean_value = float(series.iloc[start:].mean())
     return np.full(len(forecast_dates), mean_value)
 
 
@@ -117,17 +191,11 @@ def seasonal_naive_forecast(
     series: pd.Series, forecast_dates: pd.DatetimeIndex, years_back: int = 1, fallback_to_last: bool = True
 ) -> np.ndarray:
     """Forecast future dates using the same period in previous years with optional fallback."""
-    forecasts = []
-    last_value = float(series.iloc[-1])
-    for forecast_date in forecast_dates:
-        prior_date = forecast_date - DateOffset(years=years_back)
-        if prior_date in series.index:
-            forecasts.append(float(series.loc[prior_date]))
-        elif fallback_to_last:
-            forecasts.append(last_value)
-        else:
-            forecasts.append(np.nan)
-    return np.array(forecasts)
+    prior_dates = pd.DatetimeIndex(forecast_dates) - _year_offset(years_back)
+    positions = series.index.get_indexer(prior_dates)
+    fallback = float(series.iloc[-1]) if fallback_to_last else np.nan
+    values = series.to_numpy(dtype=np.float64)
+    return np.where(positions >= 0, values[positions], fallback)
 
 
 def _build_baseline_configs(
@@ -135,6 +203,7 @@ def _build_baseline_configs(
     future_dates: pd.DatetimeIndex,
     series: pd.Series,
     logger: logging.Logger,
+    rolling_engine: str = "cython",
 ) -> List[Dict[str, Callable]]:
     """
     Build baseline configuration objects for evaluation and forecasting.
@@ -142,8 +211,9 @@ def _build_baseline_configs(
     Args:
         rolling_windows_months: Rolling window sizes to include.
         future_dates: Future dates used by forecast functions.
-        series: Full historical series for availability checks.
+        series: Full historical series for availability checks, sorted by date.
         logger: Logger instance.
+        rolling_engine: pandas rolling engine for the rolling mean baselines.
 
     Returns:
         List of baseline configuration dictionaries.
@@ -162,12 +232,14 @@ def _build_baseline_configs(
             {
                 "name": f"Rolling Mean {window}M",
                 "key": f"rolling_mean_{window}m",
-                "pred_func": lambda s, w=window: rolling_mean_predictions(s, w),
+                "pred_func": lambda s, w=window: rolling_mean_predictions(s, w, engine=rolling_engine),
                 "forecast_func": lambda s, w=window: rolling_mean_forecast(s, future_dates, w),
             }
         )
 
-    history_span_days = (series.index.max() - series.index.min()).days
+    # The series index is sorted ascending, so the span is last minus first.
+    index_values = series.index.values
+    history_span_days = int((index_values[-1] - index_values[0]) // np.timedelta64(1, "D")) if len(index_values) else 0
     if history_span_days >= 365:
         baseline_configs.append(
             {
@@ -183,11 +255,60 @@ def _build_baseline_configs(
     return baseline_configs
 
 
+def _predict_baselines(baseline_configs: List[Dict[str, Callable]], series: pd.Series) -> np.ndarray:
+    """
+    Compute in-sample predictions for every baseline.
+
+    Args:
+        baseline_configs: Baseline configs with prediction callables.
+        series: Full historical series indexed by date.
+
+    Returns:
+        Array of shape ``(len(baseline_configs), len(series))`` where each row
+        holds one baseline's predictions aligned with ``series``.
+
+    The prediction functions are pure pandas/NumPy computations, so they run
+    on a thread pool; file output and logging stay sequential in the caller.
+    """
+    predictions = np.empty((len(baseline_configs), len(series)), dtype=np.float64)
+    if not baseline_configs:
+        return predictions
+
+    def _fill_row(row: int) -> None:
+        predictions[row] = np.asarray(baseline_configs[row]["pred_func"](series), dtype=np.float64)
+
+    with ThreadPoolExecutor(max_workers=len(baseline_configs)) as executor:
+        # list() re-raises the first exception from any worker
+        list(executor.map(_fill_row, range(len(baseline_configs))))
+    return predictions
+
+
+def _split_positions(series: pd.Series, split_index: pd.DatetimeIndex) -> Union[slice, np.ndarray]:
+    """
+    Return the positions of split_index dates within the series index.
+
+    Chronological splits cover a contiguous run of the series, in which case a
+    slice is returned so that selecting from prediction rows yields views
+    rather than copies. Otherwise an integer position array is returned.
+    """
+    positions = series.index.get_indexer(split_index)
+    if (positions < 0).any():
+        raise ValueError("Split dates must be present in the series used for baseline evaluation.")
+    if len(positions) == 0:
+        return slice(0, 0)
+    if (np.diff(positions) == 1).all():
+        return slice(int(positions[0]), int(positions[-1]) + 1)
+    return positions
+
+
 def _evaluate_baseline(
     baseline: Dict[str, Callable],
+    predictions: np.ndarray,
     series: pd.Series,
-    train_index: pd.DatetimeIndex,
-    test_index: pd.DatetimeIndex,
+    train_positions: Union[slice, np.ndarray],
+    test_positions: Union[slice, np.ndarray],
+    train_actual: np.ndarray,
+    test_actual: np.ndarray,
     future_dates: pd.DatetimeIndex,
     output_dir: str,
     skip_confirmation: bool,
@@ -198,9 +319,12 @@ def _evaluate_baseline(
 
     Args:
         baseline: Baseline config with prediction and forecast callables.
+        predictions: In-sample predictions for this baseline, aligned with ``series``.
         series: Full historical series indexed by date.
-        train_index: Datetime index for training range.
-        test_index: Datetime index for test range.
+        train_positions: Integer positions of the training range in ``series``.
+        test_positions: Integer positions of the test range in ``series``.
+        train_actual: Observed values for the training range.
+        test_actual: Observed values for the test range.
         future_dates: Future dates for forecasting output.
         output_dir: Directory to write prediction files.
         skip_confirmation: Whether to skip file overwrite confirmations.
@@ -209,19 +333,17 @@ def _evaluate_baseline(
     Returns:
         Metrics dictionary for the baseline.
     """
-    pred_series = baseline["pred_func"](series)
-    train_pred = pred_series.loc[train_index]
-    test_pred = pred_series.loc[test_index]
-
-    train_metrics = _filter_valid(series.loc[train_index], train_pred)
-    test_metrics = _filter_valid(series.loc[test_index], test_pred)
+    train_metrics = _filter_valid(train_actual, predictions[train_positions])
+    test_metrics = _filter_valid(test_actual, predictions[test_positions])
 
     _log_metrics(logger, baseline["name"], train_metrics, test_metrics)
 
-    future_predictions = baseline["forecast_func"](series)
-    predicted_df = pd.DataFrame(
-        {"Date": future_dates, f"Predicted {TRANSACTION_AMOUNT_LABEL}": np.round(future_predictions, 2)}
-    )
+    # Forecast functions return a fresh array, so round it in place. Rounding
+    # cannot be deferred to to_csv(float_format=...) because write_predictions
+    # sanitizes every value to a string first.
+    future_predictions = np.asarray(baseline["forecast_func"](series), dtype=np.float64)
+    np.round(future_predictions, 2, out=future_predictions)
+    predicted_df = pd.DataFrame({"Date": future_dates, f"Predicted {TRANSACTION_AMOUNT_LABEL}": future_predictions})
     output_filename = f"future_predictions_{baseline['key']}.csv"
     output_path = os.path.join(output_dir, output_filename)
     write_predictions(predicted_df, output_path, logger=logger, skip_confirmation=skip_confirmation)
@@ -248,30 +370,61 @@ def run_baselines(
     skip_confirmation: bool,
     rolling_windows_months: Iterable[int],
     logger: logging.Logger,
+    rolling_engine: str = "cython",
 ) -> List[Dict[str, float]]:
     """Run baseline forecasts, save predictions, and return metrics."""
     series = _ensure_series_with_dates(y_full, processed_dates)
     _, future_dates = prepare_future_dates(future_date_for_function)
 
-    train_index = pd.DatetimeIndex(pd.to_datetime(train_dates))
-    test_index = pd.DatetimeIndex(pd.to_datetime(test_dates))
-    baseline_configs = _build_baseline_configs(rolling_windows_months, future_dates, series, logger)
+    # Shared by every baseline: resolve the split positions and actuals once.
+    train_positions = _split_positions(series, _to_datetime_index(train_dates))
+    test_positions = _split_positions(series, _to_datetime_index(test_dates))
+    values = series.to_numpy(dtype=np.float64)
+    train_actual = values[train_positions]
+    test_actual = values[test_positions]
+
+    baseline_configs = _build_baseline_configs(
+        rolling_windows_months, future_dates, series, logger, rolling_engine=rolling_engine
+    )
+    predictions = _predict_baselines(baseline_configs, series)
 
     return [
         _evaluate_baseline(
             baseline,
+            predictions[row],
             series,
-            train_index,
-            test_index,
+            train_positions,
+            test_positions,
+            train_actual,
+            test_actual,
             future_dates,
             output_dir,
             skip_confirmation,
             logger,
         )
-        for baseline in baseline_configs
+        for row, baseline in enumerate(baseline_configs)
     ]
 
 
+def _column_or_default(df: pd.DataFrame, column: str, default: object) -> pd.Series:
+    """Return a report column, or a column filled with default when it is absent."""
+    if column in df.columns:
+        return df[column]
+    return pd.Series(default, index=df.index)
+
+
+def _format_metric_column(values: pd.Series, spec: str) -> pd.Series:
+    """Format a numeric report column as strings, rendering missing values as N/A."""
+    return values.map(lambda value: format(value, spec) if pd.notna(value) else "N/A")
+
+
+def _markdown_table_rows(columns: List[pd.Series]) -> str:
+    """Join per-column string cells into Markdown table rows."""
+    first, *rest = [column.astype(str) for column in columns]
+    rows = "| " + first.str.cat(rest, sep=" | ") + " |\n"
+    return "".join(rows)
+
+
 def write_comparison_report(
     metrics_records: List[Dict[str, float]],
     output_dir: str,
@@ -339,7 +492,9 @@ def write_comparison_report(
     
     # 1. Save CSV report
     csv_output_path = os.path.join(report_dir, filename)
-    report_df.to_csv(csv_output_path, index=False)
+    csv_content = report_df.to_csv(index=False, lineterminator="\n")
+    with open(csv_output_path, "w", encoding="utf-8", newline="") as f:
+        f.write(csv_content)
     plog.log_info(logger, f"Model comparison CSV saved to {csv_output_path}")
     
     # 2. Generate Markdown summary
@@ -359,126 +514,128 @@ def write_comparison_report(
     # Get top 3 models for display
     top_3_models = report_df.head(3)
     
-    with open(md_output_path, "w", encoding="utf-8") as f:
-        f.write("# Model Comparison Report\n\n")
-        f.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-        f.write(f"**Total Models Evaluated:** {len(report_df)}\n\n")
-        
-        f.write("---\n\n")
-        
-        # Recommendation section
-        f.write("## Recommended Production Model\n\n")
-        f.write(f"**Model:** `{best_model_name}`\n\n")
-        
-        # Performance metrics
-        f.write("### Performance Metrics\n\n")
-        f.write(f"- **Test MAE:** {best_mae:.2f}\n")
-        f.write(f"- **Test RMSE:** {best_rmse:.2f}\n")
-        if pd.notna(best_r2):
-            f.write(f"- **Test R²:** {best_r2:.4f}\n\n")
-        else:
-            f.write(f"- **Test R²:** N/A\n\n")
-        
-        # Rationale
-        f.write("### Rationale\n\n")
-        f.write(f"The **{best_model_name}** model was selected based on the following criteria:\n\n")
-        f.write(f"1. **Lowest Mean Absolute Error (MAE):** {best_mae:.2f}\n")
-        f.write(f"   - This indicates the model has the best average prediction accuracy on unseen test data\n\n")
-        f.write(f"2. **Strong Generalization Performance**\n")
-        f.write(f"   - Test RMSE: {best_rmse:.2f}\n")
-        if pd.notna(best_r2):
-            f.write(f"   - Test R²: {best_r2:.4f}\n\n")
-        
-        # Warnings if applicable
-        if pd.notna(best_r2):
-            if best_r2 < 0:
-                f.write("**WARNING:** The recommended model has a negative R² score, ")
-                f.write("indicating predictions are worse than a simple mean baseline. ")
-                f.write("Consider:\n")
-                f.write("- Collecting more training data\n")
-                f.write("- Feature engineering improvements\n")
-                f.write("- Alternative modeling approaches\n\n")
-            elif best_r2 < 0.3:
-                f.write("**NOTE:** The R² score is relatively low (< 0.3), ")
-                f.write("suggesting limited predictive power. Consider collecting more data or ")
-                f.write("engineering additional features.\n\n")
-        
-        f.write("---\n\n")
-        
-        # Top 3 models section
-        f.write("## Top 3 Models\n\n")
-        f.write("| Rank | Model | Type | Test MAE | Test RMSE | Test R² |\n")
-        f.write("|------|-------|------|----------|-----------|----------|\n")
-        
-        for idx, (_, row) in enumerate(top_3_models.iterrows(), 1):
-            model_name = row["Model"]
-            model_type = row.get("Type", "ML")
-            mae = row[TEST_MAE_COLUMN]
-            rmse = row[TEST_RMSE_COLUMN]
-            r2 = row["Test R2"]
-            
-            # Add warning emoji if R² is negative
-            r2_display = f"{r2:.4f}" if pd.notna(r2) else "N/A"
-            warning = " ⚠️" if pd.notna(r2) and r2 < 0 else ""
-            
-            f.write(f"| {idx} | {model_name} | {model_type} | {mae:.2f} | {rmse:.2f} | {r2_display}{warning} |\n")
-        
-        f.write("\n")
-        
-        # Warning summary if there are negative R² models
-        if negative_r2_count > 0:
-            f.write(f"**Warning:** {negative_r2_count} model(s) have negative R² scores (marked with ⚠️)\n\n")
-        
-        f.write("---\n\n")
-        
-        # Complete rankings section
-        f.write("## Complete Model Rankings\n\n")
-        f.write("| Rank | Model | Type | Test MAE | Test RMSE | Test R² | Train MAE | Train RMSE | Train R² | Warning |\n")
-        f.write("|------|-------|------|----------|-----------|---------|-----------|------------|----------|----------|\n")
-        
-        for idx, (_, row) in enumerate(report_df.iterrows(), 1):
-            model_name = row["Model"]
-            model_type = row.get("Type", "ML")
-            test_mae = row[TEST_MAE_COLUMN]
-            test_rmse = row[TEST_RMSE_COLUMN]
-            test_r2 = row["Test R2"]
-            train_mae = row.get("Train MAE", np.nan)
-            train_rmse = row.get("Train RMSE", np.nan)
-            train_r2 = row.get("Train R2", np.nan)
-            warning = row.get("R2 Warning", "")
-            
-            # Format values
-            test_r2_str = f"{test_r2:.4f}" if pd.notna(test_r2) else "N/A"
-            train_mae_str = f"{train_mae:.2f}" if pd.notna(train_mae) else "N/A"
-            train_rmse_str = f"{train_rmse:.2f}" if pd.notna(train_rmse) else "N/A"
-            train_r2_str = f"{train_r2:.4f}" if pd.notna(train_r2) else "N/A"
-            
-            f.write(f"| {idx} | {model_name} | {model_type} | {test_mae:.2f} | {test_rmse:.2f} | ")
-            f.write(f"{test_r2_str} | {train_mae_str} | {train_rmse_str} | {train_r2_str} | {warning} |\n")
-        
-        f.write("\n---\n\n")
-        
-        # Instructions for switching models
-        f.write("## How to Switch Production Models\n\n")
-        f.write("To change the default production model:\n\n")
-        f.write("1. Open `config.yaml` in your project root\n")
-        f.write("2. Locate the `production` section\n")
-        f.write("3. Update the `default_model` field\n\n")
-        f.write("**Valid model options:**\n")
-        f.write("- `Linear Regression`\n")
-        f.write("- `Decision Tree`\n")
-        f.write("- `Random Forest`\n")
-        f.write("- `Gradient Boosting`\n\n")
-        f.write("**Example configuration:**\n")
-        f.write("```yaml\n")
-        f.write("production:\n")
-        f.write(f"  default_model: \"{best_model_name}\"\n")
-        f.write("```\n\n")
-        f.write("After updating the configuration, the selected model will be used for all future predictions.\n\n")
-        
-        f.write("---\n\n")
-        f.write("*This report was automatically generated by the Expense Predictor system.*\n")
+    parts: List[str] = []
+    parts.append("# Model Comparison Report\n\n")
+    parts.append(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+    parts.append(f"**Total Models Evaluated:** {len(report_df)}\n\n")
+    
+    parts.append("---\n\n")
     
+    # Recommendation section
+    parts.append("## Recommended Production Model\n\n")
+    parts.append(f"**Model:** `{best_model_name}`\n\n")
+    
+    # Performance metrics
+    parts.append("### Performance Metrics\n\n")
+    parts.append(f"- **Test MAE:** {best_mae:.2f}\n")
+    parts.append(f"- **Test RMSE:** {best_rmse:.2f}\n")
+    if pd.notna(best_r2):
+        parts.append(f"- **Test R²:** {best_r2:.4f}\n\n")
+    else:
+        parts.append(f"- **Test R²:** N/A\n\n")
+    
+    # Rationale
+    parts.append("### Rationale\n\n")
+    parts.append(f"The **{best_model_name}** model was selected based on the following criteria:\n\n")
+    parts.append(f"1. **Lowest Mean Absolute Error (MAE):** {best_mae:.2f}\n")
+    parts.append(f"   - This indicates the model has the best average prediction accuracy on unseen test data\n\n")
+    parts.append(f"2. **Strong Generalization Performance**\n")
+    parts.append(f"   - Test RMSE: {best_rmse:.2f}\n")
+    if pd.notna(best_r2):
+        parts.append(f"   - Test R²: {best_r2:.4f}\n\n")
+    
+    # Warnings if applicable
+    if pd.notna(best_r2):
+        if best_r2 < 0:
+            parts.append("**WARNING:** The recommended model has a negative R² score, ")
+            parts.append("indicating predictions are worse than a simple mean baseline. ")
+            parts.append("Consider:\n")
+            parts.append("- Collecting more training data\n")
+            parts.append("- Feature engineering improvements\n")
+            parts.append("- Alternative modeling approaches\n\n")
+        elif best_r2 < 0.3:
+            parts.append("**NOTE:** The R² score is relatively low (< 0.3), ")
+            parts.append("suggesting limited predictive power. Consider collecting more data or ")
+            parts.append("engineering additional features.\n\n")
+    
+    parts.append("---\n\n")
+    
+    # Top 3 models section
+    parts.append("## Top 3 Models\n\n")
+    parts.append("| Rank | Model | Type | Test MAE | Test RMSE | Test R² |\n")
+    parts.append("|------|-------|------|----------|-----------|----------|\n")
+    
+    top_3_r2 = _format_metric_column(top_3_models["Test R2"], ".4f")
+    top_3_r2 = top_3_r2.where(~(top_3_models["Test R2"] < 0), top_3_r2 + " ⚠️")
+    parts.append(
+        _markdown_table_rows(
+            [
+                pd.Series(np.arange(1, len(top_3_models) + 1), index=top_3_models.index).astype(str),
+                top_3_models["Model"].astype(str),
+                _column_or_default(top_3_models, "Type", "ML"),
+                _format_metric_column(top_3_models[TEST_MAE_COLUMN], ".2f"),
+                _format_metric_column(top_3_models[TEST_RMSE_COLUMN], ".2f"),
+                top_3_r2,
+            ]
+        )
+    )
+    
+    parts.append("\n")
+    
+    # Warning summary if there are negative R² models
+    if negative_r2_count > 0:
+        parts.append(f"**Warning:** {negative_r2_count} model(s) have negative R² scores (marked with ⚠️)\n\n")
+    
+    parts.append("---\n\n")
+    
+    # Complete rankings section
+    parts.append("## Complete Model Rankings\n\n")
+    parts.append("| Rank | Model | Type | Test MAE | Test RMSE | Test R² | Train MAE | Train RMSE | Train R² | Warning |\n")
+    parts.append("|------|-------|------|----------|-----------|---------|-----------|------------|----------|----------|\n")
+    
+    parts.append(
+        _markdown_table_rows(
+            [
+                pd.Series(np.arange(1, len(report_df) + 1), index=report_df.index).astype(str),
+                report_df["Model"].astype(str),
+                _column_or_default(report_df, "Type", "ML"),
+                _format_metric_column(report_df[TEST_MAE_COLUMN], ".2f"),
+                _format_metric_column(report_df[TEST_RMSE_COLUMN], ".2f"),
+                _format_metric_column(report_df["Test R2"], ".4f"),
+                _format_metric_column(_column_or_default(report_df, "Train MAE", np.nan), ".2f"),
+                _format_metric_column(_column_or_default(report_df, "Train RMSE", np.nan), ".2f"),
+                _format_metric_column(_column_or_default(report_df, "Train R2", np.nan), ".4f"),
+                _column_or_default(report_df, "R2 Warning", ""),
+            ]
+        )
+    )
+    
+    parts.append("\n---\n\n")
+    
+    # Instructions for switching models
+    parts.append("## How to Switch Production Models\n\n")
+    parts.append("To change the default production model:\n\n")
+    parts.append("1. Open `config.yaml` in your project root\n")
+    parts.append("2. Locate the `production` section\n")
+    parts.append("3. Update the `default_model` field\n\n")
+    parts.append("**Valid model options:**\n")
+    parts.append("- `Linear Regression`\n")
+    parts.append("- `Decision Tree`\n")
+    parts.append("- `Random Forest`\n")
+    parts.append("- `Gradient Boosting`\n\n")
+    parts.append("**Example configuration:**\n")
+    parts.append("```yaml\n")
+    parts.append("production:\n")
+    parts.append(f"  default_model: \"{best_model_name}\"\n")
+    parts.append("```\n\n")
+    parts.append("After updating the configuration, the selected model will be used for all future predictions.\n\n")
+    
+    parts.append("---\n\n")
+    parts.append("*This report was automatically generated by the Expense Predictor system.*\n")
+
+    with open(md_output_path, "w", encoding="utf-8", newline="\n") as f:
+        f.write("".join(parts))
+
     plog.log_info(logger, f"Model comparison summary saved to {md_output_path}")
     plog.log_info(logger, f"Best performing model: {best_model_name} (Test MAE: {best_mae:.2f})")
     
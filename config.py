@@ -6,13 +6,18 @@ All configurable parameters (magic numbers, hyperparameters) are centralized her
 Configuration values are validated using Pydantic for type safety and early error detection.
 """
 
+import hashlib
+import json
 import os
-from typing import Any, Dict, Literal, Optional
+import re
+import tempfile
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Annotated, Any, Dict, Literal, Mapping, Optional
 
-import yaml
-from pydantic import BaseModel, Field, ValidationError, field_validator
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, ValidationError, field_validator
+from pydantic_core import from_json, to_json
 
-import python_logging_framework as plog
 from exceptions import ConfigurationError
 
 # Get the directory where this script is located
@@ -22,54 +27,83 @@ CONFIG_FILE = os.path.join(SCRIPT_DIR, "config.yaml")
 # Message constants
 _DEFAULT_CONFIG_MSG = "Using default configuration."
 
+# Last validated configuration, keyed by (path, mtime_ns, size) of the file it was loaded from
+_CONFIG_CACHE: Dict[str, Any] = {"key": None, "value": None}
+
+# Opt-in persisted cache of the validated configuration, written next to config.yaml
+CONFIG_CACHE_ENV_VAR = "EXPENSE_PREDICTOR_CONFIG_CACHE"
+_CONFIG_CACHE_SUFFIX = ".cache.json"
+
 # Field description constants (to avoid duplication)
 _DESC_RANDOM_STATE = "Random seed for reproducibility"
 _DESC_MIN_SAMPLES_SPLIT = "Minimum samples required to split an internal node"
 _DESC_MIN_SAMPLES_LEAF = "Minimum samples required at a leaf node"
 
 
+# Named max_features options accepted by the tree ensembles
+_MAX_FEATURES_OPTIONS = ("sqrt", "log2", "auto", None)
+_VALID_MAX_FEATURES = frozenset(_MAX_FEATURES_OPTIONS)
+# Numeric max_features given as a string, e.g. "3", "0.5" or "-1"
+_NUMERIC_MAX_FEATURES_RE = re.compile(r"-?(?:[0-9]+\.?[0-9]*|\.[0-9]+)")
+
+
+def _validate_max_features(v: str) -> str:
+    """Validate max_features is a named option or a number."""
+    if v in _VALID_MAX_FEATURES:
+        return v
+    if not _NUMERIC_MAX_FEATURES_RE.fullmatch(v):
+        raise ValueError(f"max_features must be one of {list(_MAX_FEATURES_OPTIONS)} or a number, got '{v}'")
+    return v
+
+
+# One shared validator in the core schema for every model with a max_features field
+_MaxFeaturesStr = Annotated[str, AfterValidator(_validate_max_features)]
+
+
+# Element types for list fields; the bounds are enforced by pydantic-core without a Python validator
+_PositiveInt = Annotated[int, Field(gt=0)]
+_RollingWindowSize = Annotated[int, Field(ge=2)]
+_SubsampleFraction = Annotated[float, Field(gt=0.0, le=1.0)]
+
+
 # Pydantic models for configuration validation
-class LoggingConfig(BaseModel):
-    """Configuration for logging settings."""
+class _StrictModel(BaseModel):
+    """Base class for configuration models: strict types, immutable, unknown keys rejected."""
+
+    model_config = ConfigDict(strict=True, frozen=True, extra="forbid")
 
-    model_config = {"strict": True}
+
+class LoggingConfig(_StrictModel):
+    """Configuration for logging settings."""
 
     level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = "INFO"
 
 
-class DataProcessingConfig(BaseModel):
+class DataProcessingConfig(_StrictModel):
     """Configuration for data processing parameters."""
 
-    model_config = {"strict": True}
-
     skiprows: int = Field(default=12, ge=0, description="Number of rows to skip when reading data files")
 
 
-class ModelEvaluationConfig(BaseModel):
+class ModelEvaluationConfig(_StrictModel):
     """Configuration for model evaluation parameters."""
 
-    model_config = {"strict": True}
-
     test_size: float = Field(default=0.2, gt=0.0, lt=1.0, description="Fraction of data to use for testing (must be between 0 and 1)")
     random_state: int = Field(default=42, ge=0, description=_DESC_RANDOM_STATE)
     min_total_samples: int = Field(default=30, ge=1, description="Minimum total samples required for training")
     min_test_samples: int = Field(default=10, ge=1, description="Minimum test samples required after split")
 
 
-class TargetTransformConfig(BaseModel):
+class TargetTransformConfig(_StrictModel):
     """Configuration for target variable transformation."""
 
-    model_config = {"strict": True}
-
     enabled: bool = Field(default=False, description="Enable/disable target variable transformation")
     method: Literal["log1p", "log"] = Field(default="log1p", description="Transformation method (log1p or log)")
 
 
-class DecisionTreeConfig(BaseModel):
+class DecisionTreeConfig(_StrictModel):
     """Configuration for Decision Tree model hyperparameters."""
 
-    model_config = {"strict": True}
-
     max_depth: int = Field(default=5, ge=1, description="Maximum depth of the tree")
     min_samples_split: int = Field(default=10, ge=2, description=_DESC_MIN_SAMPLES_SPLIT)
     min_samples_leaf: int = Field(default=5, ge=1, description=_DESC_MIN_SAMPLES_LEAF)
@@ -77,102 +111,56 @@ class DecisionTreeConfig(BaseModel):
     random_state: int = Field(default=42, ge=0, description=_DESC_RANDOM_STATE)
 
 
-class RandomForestConfig(BaseModel):
+class RandomForestConfig(_StrictModel):
     """Configuration for Random Forest model hyperparameters."""
 
-    model_config = {"strict": True}
-
     n_estimators: int = Field(default=100, ge=1, description="Number of trees in the forest")
     max_depth: int = Field(default=10, ge=1, description="Maximum depth of each tree")
     min_samples_split: int = Field(default=10, ge=2, description=_DESC_MIN_SAMPLES_SPLIT)
     min_samples_leaf: int = Field(default=5, ge=1, description=_DESC_MIN_SAMPLES_LEAF)
-    max_features: str = Field(default="sqrt", description="Number of features to consider for best split")
+    max_features: _MaxFeaturesStr = Field(default="sqrt", description="Number of features to consider for best split")
     ccp_alpha: float = Field(default=0.01, ge=0.0, description="Complexity parameter for pruning")
     random_state: int = Field(default=42, ge=0, description=_DESC_RANDOM_STATE)
 
-    @field_validator("max_features")
-    @classmethod
-    def validate_max_features(cls, v: str) -> str:
-        """Validate max_features is a valid option."""
-        valid_options = ["sqrt", "log2", "auto", None]
-        if v not in valid_options and not v.replace(".", "").replace("-", "").isdigit():
-            raise ValueError(f"max_features must be one of {valid_options} or a number, got '{v}'")
-        return v
-
 
-class GradientBoostingConfig(BaseModel):
+class GradientBoostingConfig(_StrictModel):
     """Configuration for Gradient Boosting model hyperparameters."""
 
-    model_config = {"strict": True}
-
     n_estimators: int = Field(default=100, ge=1, description="Number of boosting stages")
     learning_rate: float = Field(default=0.1, gt=0.0, le=1.0, description="Learning rate shrinks contribution of each tree")
     max_depth: int = Field(default=5, ge=1, description="Maximum depth of each tree")
     min_samples_split: int = Field(default=10, ge=2, description=_DESC_MIN_SAMPLES_SPLIT)
     min_samples_leaf: int = Field(default=5, ge=1, description=_DESC_MIN_SAMPLES_LEAF)
-    max_features: str = Field(default="sqrt", description="Number of features to consider for best split")
+    max_features: _MaxFeaturesStr = Field(default="sqrt", description="Number of features to consider for best split")
     random_state: int = Field(default=42, ge=0, description=_DESC_RANDOM_STATE)
 
-    @field_validator("max_features")
-    @classmethod
-    def validate_max_features(cls, v: str) -> str:
-        """Validate max_features is a valid option."""
-        valid_options = ["sqrt", "log2", "auto", None]
-        if v not in valid_options and not v.replace(".", "").replace("-", "").isdigit():
-            raise ValueError(f"max_features must be one of {valid_options} or a number, got '{v}'")
-        return v
-
 
-class DecisionTreeTuningGrid(BaseModel):
+class DecisionTreeTuningGrid(_StrictModel):
     """Constrained tuning grid for Decision Tree."""
 
-    model_config = {"strict": True}
-
     max_depth: list[int] = Field(default_factory=lambda: [3, 4, 5, 6], min_length=1)
     min_samples_leaf: list[int] = Field(default_factory=lambda: [5, 10, 20], min_length=1)
 
 
-class RandomForestTuningGrid(BaseModel):
+class RandomForestTuningGrid(_StrictModel):
     """Constrained tuning grid for Random Forest."""
 
-    model_config = {"strict": True}
-
     max_depth: list[int] = Field(default_factory=lambda: [4, 6, 8, 10], min_length=1)
     min_samples_leaf: list[int] = Field(default_factory=lambda: [2, 5, 10], min_length=1)
-    subsample: list[float] = Field(default_factory=lambda: [0.6, 0.8, 1.0], min_length=1)
+    subsample: list[_SubsampleFraction] = Field(default_factory=lambda: [0.6, 0.8, 1.0], min_length=1)
 
-    @field_validator("subsample")
-    @classmethod
-    def validate_subsample(cls, v: list[float]) -> list[float]:
-        """Validate subsample values are in (0, 1]."""
-        if any(value <= 0 or value > 1 for value in v):
-            raise ValueError("subsample values must be in the (0, 1] range")
-        return v
 
-
-class GradientBoostingTuningGrid(BaseModel):
+class GradientBoostingTuningGrid(_StrictModel):
     """Constrained tuning grid for Gradient Boosting."""
 
-    model_config = {"strict": True}
-
     max_depth: list[int] = Field(default_factory=lambda: [2, 3, 4, 5], min_length=1)
     min_samples_leaf: list[int] = Field(default_factory=lambda: [5, 10, 20], min_length=1)
-    subsample: list[float] = Field(default_factory=lambda: [0.6, 0.8, 1.0], min_length=1)
-
-    @field_validator("subsample")
-    @classmethod
-    def validate_subsample(cls, v: list[float]) -> list[float]:
-        """Validate subsample values are in (0, 1]."""
-        if any(value <= 0 or value > 1 for value in v):
-            raise ValueError("subsample values must be in the (0, 1] range")
-        return v
+    subsample: list[_SubsampleFraction] = Field(default_factory=lambda: [0.6, 0.8, 1.0], min_length=1)
 
 
-class TuningConfig(BaseModel):
+class TuningConfig(_StrictModel):
     """Configuration for constrained hyperparameter tuning."""
 
-    model_config = {"strict": True}
-
     enabled: bool = Field(default=True, description="Enable constrained hyperparameter tuning")
     time_series_splits: int = Field(default=4, ge=2, description="Number of time-series CV splits")
     top_k_log: int = Field(default=5, ge=1, description="Number of top configurations to log")
@@ -186,55 +174,33 @@ class TuningConfig(BaseModel):
     gradient_boosting: GradientBoostingTuningGrid = Field(default_factory=GradientBoostingTuningGrid)
 
 
-class BaselinesConfig(BaseModel):
+class BaselinesConfig(_StrictModel):
     """Configuration for baseline forecasts."""
 
-    model_config = {"strict": True}
-
     enabled: bool = True
-    rolling_windows_months: list[int] = Field(default_factory=lambda: [3, 6], min_length=1)
+    rolling_windows_months: list[_PositiveInt] = Field(default_factory=lambda: [3, 6], min_length=1)
+    rolling_engine: Literal["cython", "numba"] = Field(
+        default="cython",
+        description="pandas rolling engine for rolling mean baselines (numba requires the numba package)",
+    )
 
-    @field_validator("rolling_windows_months")
-    @classmethod
-    def validate_rolling_windows_months(cls, v: list[int]) -> list[int]:
-        """Ensure rolling window sizes are positive integers."""
-        if any(window <= 0 for window in v):
-            raise ValueError("rolling_windows_months must contain positive integers")
-        return v
-    
 
-class FeatureEngineeringConfig(BaseModel):
+class FeatureEngineeringConfig(_StrictModel):
     """Configuration for time-series feature engineering."""
 
-    model_config = {"strict": True}
-
     enabled: bool = Field(default=True, description="Enable time-series feature engineering")
-    lags: list[int] = Field(default_factory=lambda: [1, 3, 6, 12])
-    rolling_windows: list[int] = Field(default_factory=lambda: [7, 14, 30])
+    lags: list[_PositiveInt] = Field(default_factory=lambda: [1, 3, 6, 12])
+    rolling_windows: list[_RollingWindowSize] = Field(default_factory=lambda: [7, 14, 30])
     calendar: bool = Field(default=True, description="Enable quarter and year calendar features")
-
-    @field_validator("lags")
-    @classmethod
-    def validate_lags(cls, v: list[int]) -> list[int]:
-        """Ensure lag values are positive integers when provided."""
-        if v and any(lag <= 0 for lag in v):
-            raise ValueError("lags must contain positive integers")
-        return v
-
-    @field_validator("rolling_windows")
-    @classmethod
-    def validate_rolling_windows(cls, v: list[int]) -> list[int]:
-        """Ensure rolling window sizes are positive integers >= 2 when provided."""
-        if v and any(window < 2 for window in v):
-            raise ValueError("rolling_windows must contain integers >= 2")
-        return v
+    day_of_week_encoding: Literal["onehot", "ordinal"] = Field(
+        default="onehot",
+        description="Day-of-week encoding: six one-hot columns, or one ordinal column for tree-based models",
+    )
 
 
-class ProductionConfig(BaseModel):
+class ProductionConfig(_StrictModel):
     """Configuration for production model selection."""
 
-    model_config = {"strict": True}
-
     default_model: str = Field(
         default="Gradient Boosting",
         description="Default model for production predictions"
@@ -257,11 +223,9 @@ class ProductionConfig(BaseModel):
         return v
 
 
-class SARIMAXConfig(BaseModel):
+class SARIMAXConfig(_StrictModel):
     """Configuration for SARIMAX forecasting."""
 
-    model_config = {"strict": True}
-
     enabled: bool = Field(default=True, description="Enable SARIMAX forecasting model")
     order: list[int] = Field(default_factory=lambda: [1, 1, 1], min_length=3, max_length=3)
     seasonal_order: list[int] = Field(default_factory=lambda: [1, 1, 1, 7], min_length=4, max_length=4)
@@ -269,11 +233,9 @@ class SARIMAXConfig(BaseModel):
     use_exogenous: bool = Field(default=True)
 
 
-class ProphetConfig(BaseModel):
+class ProphetConfig(_StrictModel):
     """Configuration for Prophet forecasting."""
 
-    model_config = {"strict": True}
-
     enabled: bool = Field(default=True, description="Enable Prophet forecasting model")
     yearly_seasonality: bool = Field(default=True)
     weekly_seasonality: bool = Field(default=True)
@@ -283,22 +245,18 @@ class ProphetConfig(BaseModel):
     use_exogenous: bool = Field(default=True)
 
 
-class TimeSeriesModelsConfig(BaseModel):
+class TimeSeriesModelsConfig(_StrictModel):
     """Configuration for dedicated time-series forecasting models."""
 
-    model_config = {"strict": True}
-
     enabled: bool = Field(default=False, description="Enable dedicated time-series models")
     save_artifacts: bool = Field(default=True, description="Persist fitted model artifacts")
     sarimax: SARIMAXConfig = Field(default_factory=SARIMAXConfig)
     prophet: ProphetConfig = Field(default_factory=ProphetConfig)
 
 
-class QuantileForecastingConfig(BaseModel):
+class QuantileForecastingConfig(_StrictModel):
     """Configuration for quantile regression forecasting."""
 
-    model_config = {"strict": True}
-
     enabled: bool = Field(default=False, description="Enable quantile regression forecasting")
     quantiles: list[float] = Field(
         default_factory=lambda: [0.50, 0.75, 0.90],
@@ -321,7 +279,7 @@ class QuantileForecastingConfig(BaseModel):
         return sorted(v)
 
 
-class Config(BaseModel):
+class Config(_StrictModel):
     """Root configuration model with all sections."""
 
     logging: LoggingConfig = Field(default_factory=LoggingConfig)
@@ -339,77 +297,85 @@ class Config(BaseModel):
     quantile_forecasting: QuantileForecastingConfig = Field(default_factory=QuantileForecastingConfig)
 
 
-# Default configuration (used as fallback if config.yaml is not found or incomplete)
-DEFAULT_CONFIG = {
-    "logging": {"level": "INFO"},
-    "data_processing": {"skiprows": 12},
-    "model_evaluation": {"test_size": 0.2, "random_state": 42, "min_total_samples": 30, "min_test_samples": 10},
-    "target_transform": {"enabled": False, "method": "log1p"},
-    "decision_tree": {"max_depth": 5, "min_samples_split": 10, "min_samples_leaf": 5, "ccp_alpha": 0.01, "random_state": 42},
-    "random_forest": {
-        "n_estimators": 100,
-        "max_depth": 10,
-        "min_samples_split": 10,
-        "min_samples_leaf": 5,
-        "max_features": "sqrt",
-        "ccp_alpha": 0.01,
-        "random_state": 42,
-    },
-    "gradient_boosting": {
-        "n_estimators": 100,
-        "learning_rate": 0.1,
-        "max_depth": 5,
-        "min_samples_split": 10,
-        "min_samples_leaf": 5,
-        "max_features": "sqrt",
-        "random_state": 42,
-    },
-    "tuning": {
-        "enabled": True,
-        "time_series_splits": 4,
-        "top_k_log": 5,
-        "reuse_saved_params": True,
-        "persist_path": "reports/best_hyperparameters.json",
-        "decision_tree": {"max_depth": [3, 4, 5, 6], "min_samples_leaf": [5, 10, 20]},
-        "random_forest": {
-            "max_depth": [4, 6, 8, 10],
-            "min_samples_leaf": [2, 5, 10],
-            "subsample": [0.6, 0.8, 1.0],
-        },
-        "gradient_boosting": {
-            "max_depth": [2, 3, 4, 5],
-            "min_samples_leaf": [5, 10, 20],
-            "subsample": [0.6, 0.8, 1.0],
-        },
-    },
-    "baselines": {"enabled": True, "rolling_windows_months": [3, 6]},
-    "feature_engineering": {"enabled": True, "lags": [1, 3, 6, 12], "rolling_windows": [7, 14, 30], "calendar": True},
-    "time_series_models": {
-        "enabled": False,
-        "save_artifacts": True,
-        "sarimax": {
-            "enabled": True,
-            "order": [1, 1, 1],
-            "seasonal_order": [1, 1, 1, 7],
-            "trend": "c",
-            "use_exogenous": True,
-        },
-        "prophet": {
-            "enabled": True,
-            "yearly_seasonality": True,
-            "weekly_seasonality": True,
-            "daily_seasonality": False,
-            "seasonality_mode": "additive",
-            "changepoint_prior_scale": 0.05,
-            "use_exogenous": True,
-        },
-    },
-    "production": {"default_model": "Gradient Boosting"},
-    "quantile_forecasting": {
-        "enabled": False,
-        "quantiles": [0.50, 0.75, 0.90],
-        "model_type": "gradient_boosting",
-    },
+def _freeze_config(value: Any) -> Any:
+    """
+    Recursively make a configuration tree read-only.
+
+    Dictionaries are wrapped in MappingProxyType views and lists (e.g. ``lags`` or the
+    tuning grids) are converted to tuples, so no caller can change the shared instance.
+    The dictionaries are wrapped in place rather than copied, so ``value`` must be a
+    freshly built tree (e.g. from ``model_dump()``) that no other code holds on to.
+    """
+    if isinstance(value, dict):
+        for key, item in value.items():
+            value[key] = _freeze_config(item)
+        return MappingProxyType(value)
+    if isinstance(value, list):
+        return tuple(_freeze_config(item) for item in value)
+    return value
+
+
+def copy_config(value: Any) -> Any:
+    """
+    Return a mutable deep copy of a configuration tree or section.
+
+    Undoes _freeze_config(): read-only mappings become dictionaries and tuples become
+    lists, so the copy can be edited, serialised with ``json.dumps`` or validated again
+    with ``Config.model_validate``. The shared configuration itself is left unchanged.
+
+    Parameters:
+        value: The configuration returned by get_config(), DEFAULT_CONFIG, or a section.
+
+    Returns:
+        The same settings as plain dictionaries and lists.
+    """
+    if isinstance(value, Mapping):
+        return {key: copy_config(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [copy_config(item) for item in value]
+    return value
+
+
+# Default configuration (used as fallback if config.yaml is not found or unreadable).
+# Built from the Pydantic model defaults, so the fallback returns exactly what loading
+# an empty config.yaml would. model_construct() skips validating an empty input; the
+# section defaults come from their default factories either way. Frozen like the
+# loaded configuration so it can be returned and shared without copying.
+DEFAULT_CONFIG: Mapping[str, Any] = _freeze_config(Config.model_construct().model_dump())
+
+
+def _format_literal_error(field_path: str, error: Dict[str, Any]) -> str:
+    """Format a Literal mismatch, listing the accepted values."""
+    expected = error.get("ctx", {}).get("expected", "")
+    return f"Invalid value for '{field_path}': {error['msg']} Expected one of: {expected}"
+
+
+def _format_bound_error(field_path: str, error: Dict[str, Any]) -> str:
+    """Format a numeric bound (gt/ge/lt/le) violation."""
+    return f"Invalid value for '{field_path}': {error['msg']}"
+
+
+def _format_parsing_error(field_path: str, error: Dict[str, Any]) -> str:
+    """Format a value that could not be parsed as the expected number type."""
+    expected_type = "integer" if error["type"].startswith("int") else "float"
+    return f"Invalid type for '{field_path}': expected {expected_type}, got '{error.get('input', '')}'"
+
+
+def _format_generic_error(field_path: str, error: Dict[str, Any]) -> str:
+    """Format any other validation error using Pydantic's message."""
+    return f"Invalid configuration for '{field_path}': {error['msg']}"
+
+
+# Pydantic error type -> formatter; unlisted types use _format_generic_error
+_VALIDATION_ERROR_FORMATTERS = {
+    "literal_error": _format_literal_error,
+    "greater_than": _format_bound_error,
+    "greater_than_equal": _format_bound_error,
+    "less_than": _format_bound_error,
+    "less_than_equal": _format_bound_error,
+    "int_parsing": _format_parsing_error,
+    "int_parsing_size": _format_parsing_error,
+    "float_parsing": _format_parsing_error,
 }
 
 
@@ -423,30 +389,20 @@ def _format_validation_error(error: Dict[str, Any]) -> str:
     Returns:
         str: A formatted, user-friendly error message
     """
-    field_path = ".".join(str(loc) for loc in error["loc"])
-    error_type = error["type"]
-    error_msg = error["msg"]
-
-    # Create user-friendly error message based on error type
-    if "literal_error" in error_type:
-        expected = error.get("ctx", {}).get("expected", "")
-        return f"Invalid value for '{field_path}': {error_msg} Expected one of: {expected}"
-    elif any(keyword in error_type for keyword in ["greater_than", "less_than", "greater_than_equal", "less_than_equal"]):
-        return f"Invalid value for '{field_path}': {error_msg}"
-    elif "int_parsing" in error_type or "float_parsing" in error_type:
-        input_value = error.get("input", "")
-        expected_type = "integer" if "int" in error_type else "float"
-        return f"Invalid type for '{field_path}': expected {expected_type}, got '{input_value}'"
-    else:
-        return f"Invalid configuration for '{field_path}': {error_msg}"
-
-
-def _validate_and_parse_config(merged_config: Dict[str, Any]) -> Dict[str, Any]:
+    field_path = ".".join(map(str, error["loc"]))
+    formatter = _VALIDATION_ERROR_FORMATTERS.get(error["type"], _format_generic_error)
+    return formatter(field_path, error)
+
+
+def _validate_and_parse_config(raw_config: Dict[str, Any]) -> Dict[str, Any]:
     """
     Validate configuration using Pydantic and return validated dict.
 
+    Missing sections and keys are filled in from the Pydantic model defaults,
+    so partial configurations do not need to be merged with DEFAULT_CONFIG first.
+
     Parameters:
-        merged_config (dict): Merged configuration dictionary
+        raw_config (dict): Configuration dictionary as parsed from config.yaml
 
     Returns:
         dict: Validated configuration dictionary
@@ -455,7 +411,7 @@ def _validate_and_parse_config(merged_config: Dict[str, Any]) -> Dict[str, Any]:
         ConfigurationError: If validation fails with user-friendly error messages
     """
     try:
-        validated = Config(**merged_config)
+        validated = Config.model_validate(raw_config)
         return validated.model_dump()
     except ValidationError as e:
         # Format all validation errors for better readability
@@ -464,80 +420,205 @@ def _validate_and_parse_config(merged_config: Dict[str, Any]) -> Dict[str, Any]:
         raise ConfigurationError(f"Configuration validation failed:\n  - {error_summary}") from e
 
 
-def load_config() -> Dict[str, Any]:
+@lru_cache(maxsize=1)
+def _yaml_loader() -> Any:
+    """Return the libyaml-backed safe loader, or the pure-Python one when PyYAML was built without it."""
+    try:
+        from yaml import CSafeLoader
+
+        return CSafeLoader
+    except ImportError:
+        from yaml import SafeLoader
+
+        return SafeLoader
+
+
+@lru_cache(maxsize=1)
+def _config_schema_fingerprint() -> str:
+    """Return a hash of the Config schema, used to invalidate persisted caches when the models change."""
+    schema = json.dumps(Config.model_json_schema(), sort_keys=True)
+    return hashlib.sha256(schema.encode("utf-8")).hexdigest()
+
+
+def _config_cache_enabled() -> bool:
+    """Return True when the persisted JSON configuration cache is enabled."""
+    return os.getenv(CONFIG_CACHE_ENV_VAR, "false").lower() == "true"
+
+
+def _read_config_cache(cache_path: str, stat_result: os.stat_result) -> Optional[Dict[str, Any]]:
+    """
+    Read a previously validated configuration from the JSON cache file.
+
+    The file is decoded with pydantic-core's Rust JSON parser.
+
+    Parameters:
+        cache_path (str): Path of the JSON cache file
+        stat_result (os.stat_result): Current stat of config.yaml
+
+    Returns:
+        dict or None: The cached configuration, or None when the cache is missing,
+                      unreadable or was written for a different config.yaml or schema.
+    """
+    try:
+        with open(cache_path, "rb") as f:
+            cached = from_json(f.read())
+    except (OSError, ValueError):
+        return None
+
+    if (
+        not isinstance(cached, dict)
+        or cached.get("source") != [stat_result.st_mtime_ns, stat_result.st_size]
+        or cached.get("schema") != _config_schema_fingerprint()
+    ):
+        return None
+    return cached.get("config")
+
+
+def _write_config_cache(cache_path: str, stat_result: os.stat_result, validated_config: Dict[str, Any]) -> None:
+    """
+    Persist a validated configuration to the JSON cache file.
+
+    The file is written to a temporary name and moved into place with os.replace,
+    so concurrent writers never leave a partially written cache behind. Failures
+    are logged and otherwise ignored; the cache is only an optimization.
+
+    Parameters:
+        cache_path (str): Path of the JSON cache file
+        stat_result (os.stat_result): Stat of the config.yaml the configuration was loaded from
+        validated_config (dict): Validated configuration dictionary
+    """
+    payload = {
+        "schema": _config_schema_fingerprint(),
+        "source": [stat_result.st_mtime_ns, stat_result.st_size],
+        "config": validated_config,
+    }
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path) or ".", suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(to_json(payload))
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        import python_logging_framework as plog
+
+        plog.log_debug(None, f"Could not write configuration cache {cache_path}: {e}")
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def load_config() -> Mapping[str, Any]:
     """
     Load configuration from config.yaml file with type validation.
 
+    The validated configuration is cached and reused for as long as the file's
+    path, modification time and size are unchanged, so repeated calls only cost
+    a single ``os.stat``. The configuration is returned as a read-only mapping
+    (nested sections included) so every caller can share the same instance.
+
+    When the ``EXPENSE_PREDICTOR_CONFIG_CACHE`` environment variable is ``true``,
+    the validated configuration is also persisted to ``config.yaml.cache.json``
+    and reused by later processes until config.yaml or the schema changes.
+
     Returns:
-        dict: Configuration dictionary with all parameters.
-              Falls back to default values if file is not found.
+        Mapping: Read-only configuration mapping with all parameters.
+                 Falls back to default values if file is not found.
 
     Raises:
         ConfigurationError: If configuration validation fails with detailed error messages.
     """
-    if not os.path.exists(CONFIG_FILE):
+    try:
+        stat_result = os.stat(CONFIG_FILE)
+    except OSError:
+        import python_logging_framework as plog
+
         plog.log_info(None, f"config.yaml not found at {CONFIG_FILE}")
         plog.log_info(None, _DEFAULT_CONFIG_MSG)
         return DEFAULT_CONFIG
 
+    cache_key = (CONFIG_FILE, stat_result.st_mtime_ns, stat_result.st_size)
+    if _CONFIG_CACHE["key"] == cache_key:
+        return _CONFIG_CACHE["value"]
+
+    cache_path = CONFIG_FILE + _CONFIG_CACHE_SUFFIX if _config_cache_enabled() else None
+    if cache_path:
+        cached_config = _read_config_cache(cache_path, stat_result)
+        if cached_config is not None:
+            frozen_config = _freeze_config(cached_config)
+            _CONFIG_CACHE["key"] = cache_key
+            _CONFIG_CACHE["value"] = frozen_config
+            return frozen_config
+
+    # PyYAML is only needed when config.yaml actually has to be parsed
+    import yaml
+
     try:
-        with open(CONFIG_FILE, "r") as f:
-            raw_config = yaml.safe_load(f)
-            merged_config = _merge_configs(DEFAULT_CONFIG, raw_config)
-            return _validate_and_parse_config(merged_config)
+        # Read the whole file with one call and let the parser detect the encoding from the bytes
+        with open(CONFIG_FILE, "rb") as f:
+            config_bytes = f.read()
+        raw_config = yaml.load(config_bytes, Loader=_yaml_loader())
+        validated_config = _validate_and_parse_config(raw_config or {})
 
-    except (FileNotFoundError, PermissionError) as e:
-        plog.log_error(None, f"Could not access config.yaml: {e}")
-        plog.log_info(None, _DEFAULT_CONFIG_MSG)
-        return DEFAULT_CONFIG
-    except yaml.YAMLError as e:
-        plog.log_error(None, f"Invalid YAML in config.yaml: {e}")
+    except (FileNotFoundError, PermissionError, yaml.YAMLError) as e:
+        import python_logging_framework as plog
+
+        problem = "Invalid YAML in" if isinstance(e, yaml.YAMLError) else "Could not access"
+        plog.log_error(None, f"{problem} config.yaml: {e}")
         plog.log_info(None, _DEFAULT_CONFIG_MSG)
         return DEFAULT_CONFIG
     except ConfigurationError:
         # Re-raise configuration errors (validation errors with user-friendly messages)
         raise
     except Exception as e:
+        import python_logging_framework as plog
+
         plog.log_error(None, f"Unexpected error loading config.yaml: {e}")
         plog.log_error(None, "This is an unexpected error. Please report this issue.")
         raise ConfigurationError(f"Unexpected error loading config.yaml: {e}") from e
 
+    if cache_path:
+        _write_config_cache(cache_path, stat_result, validated_config)
+    frozen_config = _freeze_config(validated_config)
+    _CONFIG_CACHE["key"] = cache_key
+    _CONFIG_CACHE["value"] = frozen_config
+    return frozen_config
 
-def _merge_configs(default: Dict[str, Any], custom: Optional[Dict[str, Any]]) -> Dict[str, Any]:
-    """
-    Merge custom configuration with default configuration.
-
-    This ensures that if any keys are missing from the custom config,
-    the default values are used.
 
-    Parameters:
-        default (dict): Default configuration
-        custom (dict): Custom configuration from config.yaml
+def get_config() -> Mapping[str, Any]:
+    """
+    Get the configuration mapping.
 
     Returns:
-        dict: Merged configuration
+        Mapping: Read-only configuration mapping with all parameters.
     """
-    if custom is None:
-        return default
-
-    merged = default.copy()
-    for key, value in custom.items():
-        if isinstance(value, dict) and key in merged and isinstance(merged[key], dict):
-            merged[key] = _merge_configs(merged[key], value)
-        else:
-            merged[key] = value
-    return merged
+    return load_config()
 
 
-def get_config() -> Dict[str, Any]:
+def reload_config() -> Mapping[str, Any]:
     """
-    Get the configuration dictionary.
+    Discard the in-process configuration cache and load config.yaml again.
+
+    load_config() already notices edits through the file's modification time
+    and size; this is for callers (mainly tests) that need a fresh load
+    regardless, e.g. after replacing the file within the same timestamp tick.
 
     Returns:
-        dict: Configuration dictionary with all parameters.
+        Mapping: Read-only configuration mapping with all parameters.
     """
+    _CONFIG_CACHE["key"] = None
+    _CONFIG_CACHE["value"] = None
     return load_config()
 
 
-# Load configuration once when module is imported
-config = load_config()
+def __getattr__(name: str) -> Any:
+    """
+    Load the module-level ``config`` dictionary on first access (PEP 562).
+
+    Importing this module does no file I/O; ``config.config`` (or
+    ``from config import config``) loads and validates config.yaml the first
+    time it is used and stores the result as a regular module attribute.
+    """
+    if name == "config":
+        loaded_config = load_config()
+        globals()["config"] = loaded_config
+        return loaded_config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,7 +5,11 @@ This module centralizes all constant definitions to ensure consistency
 across the codebase and follow the DRY (Don't Repeat Yourself) principle.
 """
 
-# Column names
-TRANSACTION_AMOUNT_LABEL = "Tran Amt"
-VALUE_DATE_LABEL = "Value Date"
-DAY_OF_WEEK = "Day of the Week"
+import sys
+from typing import Final
+
+# Column names. Interned so that pandas column lookups with these keys compare by identity;
+# literals containing spaces are not interned automatically.
+TRANSACTION_AMOUNT_LABEL: Final[str] = sys.intern("Tran Amt")
+VALUE_DATE_LABEL: Final[str] = sys.intern("Value Date")
+DAY_OF_WEEK: Final[str] = sys.intern("Day of the Week")
@@ -9,15 +9,100 @@ Feature generation is deterministic: the same input data always produces
 the same output features.
 """
 
-import json
 import logging
 import os
 from typing import Any, Dict, List, Optional
 
+import numpy as np
 import pandas as pd
+from pydantic_core import to_json
 
 import python_logging_framework as plog
-from constants import TRANSACTION_AMOUNT_LABEL
+from constants import DAY_OF_WEEK, TRANSACTION_AMOUNT_LABEL
+
+# Day names in ``Series.dt.dayofweek`` order (Monday == 0).
+_DAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+# The one-hot columns ``pd.get_dummies(day_name(), drop_first=True)`` produced:
+# day names sorted alphabetically with the first (Friday) dropped.
+DAY_OF_WEEK_COLUMNS = tuple(f"{DAY_OF_WEEK}_{day}" for day in sorted(_DAY_NAMES)[1:])
+
+# Row ``d`` holds the one-hot encoding of ``dayofweek == d``.
+_DAY_OF_WEEK_TABLE = np.array(
+    [[f"{DAY_OF_WEEK}_{day}" == column for column in DAY_OF_WEEK_COLUMNS] for day in _DAY_NAMES],
+    dtype=bool,
+)
+
+
+def _append_columns(df: pd.DataFrame, columns: Dict[str, np.ndarray]) -> pd.DataFrame:
+    """Return ``df`` with ``columns`` attached in one concat, replacing any existing ones."""
+    block = pd.DataFrame(columns, index=df.index)
+    if df.columns.isin(block.columns).any():
+        df = df.drop(columns=block.columns)
+    return pd.concat([df, block], axis=1)
+
+
+def _lag_columns(values: np.ndarray, lags: List[int]) -> Dict[str, np.ndarray]:
+    """Return the ``lag_<n>`` columns for a float64 target array."""
+    # Fill every lag column into one preallocated matrix rather than
+    # shifting and inserting one column per lag.
+    n = values.shape[0]
+    lagged = np.full((n, len(lags)), np.nan, dtype=np.float64)
+    for i, lag in enumerate(lags):
+        if lag < n:
+            lagged[lag:, i] = values[: n - lag]
+    return {f"lag_{lag}": lagged[:, i] for i, lag in enumerate(lags)}
+
+
+def _rolling_columns(values: np.ndarray, windows: List[int]) -> Dict[str, np.ndarray]:
+    """Return the ``rolling_mean_<w>``/``rolling_std_<w>`` columns for a float64 target array."""
+    n = values.shape[0]
+    shifted = np.empty(n, dtype=np.float64)
+    shifted[:1] = np.nan
+    shifted[1:] = values[:-1]
+
+    # Every window's sum, sum of squares and valid count comes from the same
+    # prefix sums, so the series is scanned once for all windows. Values are
+    # centred first to limit cancellation in the sum-of-squares differences.
+    valid = ~np.isnan(shifted)
+    offset = shifted[valid].mean() if valid.any() else 0.0
+    centred = np.where(valid, shifted - offset, 0.0)
+    prefix_sum = np.concatenate(([0.0], np.cumsum(centred)))
+    prefix_sq = np.concatenate(([0.0], np.cumsum(centred * centred)))
+    prefix_count = np.concatenate(([0], np.cumsum(valid)))
+    # Runs of equal values are tracked separately so constant windows (e.g.
+    # zero-filled days) get an exact zero std, as pandas reports.
+    prefix_repeat = np.concatenate(([0, 0], np.cumsum(shifted[1:] == shifted[:-1])))
+
+    new_columns: Dict[str, np.ndarray] = {}
+    for window in windows:
+        mean = np.full(n, np.nan, dtype=np.float64)
+        std = np.full(n, np.nan, dtype=np.float64)
+        if window <= n:
+            # min_periods=window: a window containing any NaN yields NaN
+            complete = (prefix_count[window:] - prefix_count[:-window]) == window
+            total = prefix_sum[window:] - prefix_sum[:-window]
+            window_mean = total / window
+            mean[window - 1 :] = np.where(complete, window_mean + offset, np.nan)
+            if window > 1:
+                squares = prefix_sq[window:] - prefix_sq[:-window]
+                variance = np.maximum((squares - total * window_mean) / (window - 1), 0.0)
+                constant = (prefix_repeat[window:] - prefix_repeat[1 : n - window + 2]) == window - 1
+                variance[constant] = 0.0
+                std[window - 1 :] = np.where(complete, np.sqrt(variance), np.nan)
+        new_columns[f"rolling_mean_{window}"] = mean
+        new_columns[f"rolling_std_{window}"] = std
+
+    return new_columns
+
+
+def _calendar_columns(dates: pd.Series) -> Dict[str, np.ndarray]:
+    """Return the ``Quarter`` and ``Year`` columns for a datetime Series."""
+    # Quarter (1-4) and year fit in int8/int16, keeping the feature matrix small
+    return {
+        "Quarter": dates.dt.quarter.to_numpy(dtype=np.int8),
+        "Year": dates.dt.year.to_numpy(dtype=np.int16),
+    }
 
 
 def generate_lag_features(
@@ -38,15 +123,13 @@ def generate_lag_features(
 
     Returns:
         DataFrame with new lag columns appended (NaN rows at the top).
+        The input DataFrame is not modified.
     """
     if lags is None:
         lags = [1, 3, 6, 12]
 
-    result = df.copy()
-    for lag in lags:
-        result[f"lag_{lag}"] = result[target_col].shift(lag)
-
-    return result
+    values = df[target_col].to_numpy(dtype=np.float64)
+    return _append_columns(df, _lag_columns(values, lags))
 
 
 def generate_rolling_features(
@@ -67,20 +150,13 @@ def generate_rolling_features(
 
     Returns:
         DataFrame with rolling mean and std columns appended.
+        The input DataFrame is not modified.
     """
     if windows is None:
         windows = [7, 14, 30]
 
-    result = df.copy()
-    for window in windows:
-        result[f"rolling_mean_{window}"] = (
-            result[target_col].shift(1).rolling(window=window, min_periods=window).mean()
-        )
-        result[f"rolling_std_{window}"] = (
-            result[target_col].shift(1).rolling(window=window, min_periods=window).std()
-        )
-
-    return result
+    values = df[target_col].to_numpy(dtype=np.float64)
+    return _append_columns(df, _rolling_columns(values, windows))
 
 
 def generate_calendar_features(df: pd.DataFrame, date_col: str = "Date") -> pd.DataFrame:
@@ -97,17 +173,54 @@ def generate_calendar_features(df: pd.DataFrame, date_col: str = "Date") -> pd.D
 
     Returns:
         DataFrame with quarter and year columns appended.
+        The input DataFrame is not modified.
     """
-    result = df.copy()
-    result["Quarter"] = result[date_col].dt.quarter
-    result["Year"] = result[date_col].dt.year
+    return _append_columns(df, _calendar_columns(df[date_col]))
 
-    return result
+
+def generate_day_of_week_features(
+    df: pd.DataFrame,
+    date_col: str = "Date",
+    encoding: str = "onehot",
+) -> pd.DataFrame:
+    """
+    Add day-of-week features derived from the date column.
+
+    With ``onehot`` encoding the columns are looked up from the integer
+    ``dayofweek`` in a fixed 7 x 6 table, so every frame gets the same six
+    columns (``DAY_OF_WEEK_COLUMNS``, Friday being the dropped reference day)
+    regardless of which days it happens to contain. With ``ordinal``
+    encoding a single ``int8`` column holds the day number (Monday == 0),
+    which is enough for tree-based models and keeps the feature matrix small.
+
+    Parameters:
+        df: DataFrame containing a datetime column.
+        date_col: Name of the date column.
+        encoding: ``"onehot"`` or ``"ordinal"``.
+
+    Returns:
+        DataFrame with the day-of-week column(s) appended.
+        The input DataFrame is not modified.
+
+    Raises:
+        ValueError: If ``encoding`` is not supported.
+    """
+    day_of_week = df[date_col].dt.dayofweek.to_numpy()
+    if encoding == "ordinal":
+        return _append_columns(df, {DAY_OF_WEEK: day_of_week.astype(np.int8)})
+    if encoding != "onehot":
+        raise ValueError(f"Unsupported day-of-week encoding: {encoding}. Use 'onehot' or 'ordinal'.")
+
+    encoded = _DAY_OF_WEEK_TABLE[day_of_week]
+    return _append_columns(
+        df, {column: encoded[:, i] for i, column in enumerate(DAY_OF_WEEK_COLUMNS)}
+    )
 
 
 def drop_nan_from_features(
     df: pd.DataFrame,
     logger: Optional[logging.Logger] = None,
+    max_lookback: Optional[int] = None,
 ) -> pd.DataFrame:
     """
     Remove rows containing NaN values introduced by lag/rolling features.
@@ -119,12 +232,16 @@ def drop_nan_from_features(
     Parameters:
         df: DataFrame potentially containing NaN from feature engineering.
         logger: Logger instance for logging messages.
+        max_lookback: Number of leading rows left NaN by the widest lag or
+            rolling window. When given, those rows are sliced off without
+            scanning the frame for NaN; this is only equivalent when every
+            column other than the lag and rolling features is NaN-free.
 
     Returns:
         DataFrame with NaN-containing rows removed.
     """
     rows_before = len(df)
-    result = df.dropna()
+    result = df.iloc[max_lookback:] if max_lookback is not None else df.dropna()
     rows_dropped = rows_before - len(result)
 
     if rows_dropped > 0:
@@ -162,8 +279,12 @@ def save_feature_list(
             "feature_count": len(feature_names),
             "features": feature_names,
         }
-        with open(output_path, "w") as f:
-            json.dump(payload, f, indent=2)
+        # pydantic_core's Rust encoder writes the same indented layout as
+        # json.dump(indent=2), which falls back to the pure-Python encoder.
+        # Unlike json.dump's default ensure_ascii=True, non-ASCII characters
+        # in feature names are written as raw UTF-8 rather than \uXXXX escapes.
+        with open(output_path, "wb") as f:
+            f.write(to_json(payload, indent=2))
 
         plog.log_info(logger, f"Saved feature list ({len(feature_names)} features) to {output_path}")
     except OSError as exc:
@@ -201,14 +322,22 @@ def generate_timeseries_features(
 
     plog.log_info(logger, f"Generating time-series features: lags={lags}, rolling_windows={rolling_windows}, calendar={calendar_enabled}")
 
+    # All feature columns are computed from one read of the target and
+    # attached to the frame in a single concat.
+    values = df[TRANSACTION_AMOUNT_LABEL].to_numpy(dtype=np.float64)
+    features: Dict[str, np.ndarray] = {}
+    # Whether any input column (target, Date or others) has NaN/NaT; checked
+    # before the feature columns are attached, see the drop_na step below.
+    input_has_nan = drop_na and bool(df.isna().to_numpy().any())
+
     # Lag features
     if lags:
-        df = generate_lag_features(df, lags=lags)
+        features.update(_lag_columns(values, lags))
         plog.log_info(logger, f"Added {len(lags)} lag features: {[f'lag_{l}' for l in lags]}")
 
     # Rolling statistics
     if rolling_windows:
-        df = generate_rolling_features(df, windows=rolling_windows)
+        features.update(_rolling_columns(values, rolling_windows))
         plog.log_info(
             logger,
             f"Added {len(rolling_windows) * 2} rolling features "
@@ -217,12 +346,21 @@ def generate_timeseries_features(
 
     # Calendar features
     if calendar_enabled:
-        df = generate_calendar_features(df)
+        features.update(_calendar_columns(df["Date"]))
         plog.log_info(logger, "Added calendar features: Quarter, Year")
 
-    # Optionally drop NaN rows
+    if features:
+        df = _append_columns(df, features)
+
+    # Optionally drop NaN rows. When no input column has NaN, the only NaN are
+    # those of the lag and rolling features, which fill exactly the leading
+    # max(lags + rolling_windows) rows, so those rows can be sliced off instead
+    # of scanning every column. Otherwise fall back to a full dropna().
     if drop_na:
-        df = drop_nan_from_features(df, logger=logger)
+        max_lookback = None
+        if not input_has_nan:
+            max_lookback = max([*lags, *rolling_windows], default=0)
+        df = drop_nan_from_features(df, logger=logger, max_lookback=max_lookback)
 
     return df
 
@@ -236,9 +374,10 @@ def prepare_future_timeseries_features(
     """
     Generate time-series features for future dates using historical data.
 
-    Concatenates the historical tail with future dates, computes lag
-    and rolling features across the boundary, then returns only the
-    future rows with properly computed features.
+    Appends the future targets to the historical tail needed by the widest
+    lag or window, computes lag and rolling features across the boundary
+    on that array, then returns only the future rows with properly
+    computed features.
 
     Parameters:
         historical_df: Processed historical DataFrame with Date and target columns.
@@ -261,43 +400,42 @@ def prepare_future_timeseries_features(
         # rolling needs window + 1 shift
         max_lookback = max(max_lookback, max(rolling_windows) + 1)
 
-    # Take the tail of historical data needed for feature computation
+    # Take the tail of historical data needed for feature computation and
+    # append the future targets; features are computed on this array only.
     tail_rows = min(max_lookback, len(historical_df))
-    hist_tail = historical_df[["Date", TRANSACTION_AMOUNT_LABEL]].tail(tail_rows).copy()
+    history = historical_df[TRANSACTION_AMOUNT_LABEL].to_numpy(dtype=np.float64)
+    n_future = len(future_df)
 
-    # Future dates have no target values; fill with 0 for feature computation
-    future_with_target = future_df.copy()
-    if TRANSACTION_AMOUNT_LABEL not in future_with_target.columns:
-        future_with_target[TRANSACTION_AMOUNT_LABEL] = 0.0
+    # Future dates have no target values; use 0 for feature computation
+    if TRANSACTION_AMOUNT_LABEL in future_df.columns:
+        future_values = future_df[TRANSACTION_AMOUNT_LABEL].to_numpy(dtype=np.float64)
+    else:
+        future_values = np.zeros(n_future, dtype=np.float64)
+    values = np.concatenate([history[len(history) - tail_rows :], future_values])
 
-    # Combine historical tail + future dates
-    combined = pd.concat([hist_tail, future_with_target[["Date", TRANSACTION_AMOUNT_LABEL]]], ignore_index=True)
-
-    # Generate lag features on the combined data
+    features: Dict[str, np.ndarray] = {}
     if lags:
-        combined = generate_lag_features(combined, lags=lags)
-
-    # Generate rolling features on the combined data
+        features.update(_lag_columns(values, lags))
     if rolling_windows:
-        combined = generate_rolling_features(combined, windows=rolling_windows)
-
-    # Generate calendar features
-    if calendar_enabled:
-        combined = generate_calendar_features(combined)
-
-    # Extract only the future portion
-    future_portion = combined.tail(len(future_df)).copy()
-
-    # Fill any remaining NaN with 0 (for future dates beyond lookback)
-    nan_count = future_portion.isna().sum().sum()
+        features.update(_rolling_columns(values, rolling_windows))
+
+    # Keep only the future rows, filling any remaining NaN (future dates
+    # beyond the available history) with 0
+    nan_count = 0
+    for name, column in features.items():
+        future_column = column[tail_rows:]
+        missing = np.isnan(future_column)
+        nan_count += int(missing.sum())
+        future_column[missing] = 0.0
+        features[name] = future_column
     if nan_count > 0:
         plog.log_info(
             logger,
             f"Filled {nan_count} NaN values in future time-series features with 0",
         )
-        future_portion = future_portion.fillna(0.0)
 
-    # Drop the target column (not needed for prediction)
-    future_portion = future_portion.drop(columns=[TRANSACTION_AMOUNT_LABEL], errors="ignore")
+    future_dates = future_df["Date"].reset_index(drop=True)
+    if calendar_enabled:
+        features.update(_calendar_columns(future_dates))
 
-    return future_portion.reset_index(drop=True)
+    return pd.DataFrame({"Date": future_dates, **features})
@@ -3,18 +3,19 @@ import os
 import shutil
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 import xlrd
-from pandas.tseries.offsets import DateOffset
+from pandas.tseries.api import guess_datetime_format
 
 import python_logging_framework as plog
 from config import config
-from constants import DAY_OF_WEEK, TRANSACTION_AMOUNT_LABEL, VALUE_DATE_LABEL
+from constants import TRANSACTION_AMOUNT_LABEL, VALUE_DATE_LABEL
 from exceptions import DataValidationError
 from feature_engineering import (
+    generate_day_of_week_features,
     generate_timeseries_features,
     prepare_future_timeseries_features,
     save_feature_list,
@@ -47,13 +48,12 @@ def validate_csv_file(file_path: str, logger: Optional[logging.Logger] = None) -
     # Try to read the CSV and check for required columns
     try:
         df = pd.read_csv(file_path, nrows=0)  # Read only headers
-        columns = df.columns.tolist()
-
         # Check for required columns
         required_columns = ["Date", TRANSACTION_AMOUNT_LABEL]
-        missing_columns = [col for col in required_columns if col not in columns]
+        missing_columns = [col for col in required_columns if col not in df.columns]
 
         if missing_columns:
+            columns = df.columns.tolist()
             plog.log_error(logger, f"Missing required columns in CSV: {missing_columns}. Found columns: {columns}")
             raise DataValidationError(f"Missing required columns in CSV file: {missing_columns}. Found columns: {columns}")
 
@@ -78,6 +78,27 @@ def validate_excel_file(file_path: str, logger: Optional[logging.Logger] = None)
     file_path (str): Path to the Excel file
     logger (logging.Logger, optional): Logger instance for logging messages
 
+    Raises:
+    DataValidationError: If the Excel file does not exist, is not a file,
+                        has an invalid format, or is corrupted
+    """
+    _open_excel_file(file_path, logger=logger).close()
+
+
+def _open_excel_file(file_path: str, logger: Optional[logging.Logger] = None) -> pd.ExcelFile:
+    """
+    Validate an Excel file and return it opened (internal helper function).
+
+    Performs the checks of ``validate_excel_file`` and hands back the workbook it
+    opened, so a reader can use it without parsing the file a second time.
+
+    Parameters:
+    file_path (str): Path to the Excel file
+    logger (logging.Logger, optional): Logger instance for logging messages
+
+    Returns:
+    pd.ExcelFile: The opened workbook. The caller is responsible for closing it.
+
     Raises:
     DataValidationError: If the Excel file does not exist, is not a file,
                         has an invalid format, or is corrupted
@@ -107,8 +128,9 @@ def validate_excel_file(file_path: str, logger: Optional[logging.Logger] = None)
     # Try to open the Excel file to ensure it's valid
     try:
         engine = "xlrd" if file_path.endswith(".xls") else "openpyxl"
-        pd.ExcelFile(file_path, engine=engine)
+        excel_file = pd.ExcelFile(file_path, engine=engine)
         plog.log_info(logger, f"Excel file validation passed: {file_path}")
+        return excel_file
     except ImportError as e:
         # Missing openpyxl dependency for .xlsx files
         if "openpyxl" in str(e):
@@ -135,7 +157,7 @@ def validate_excel_file(file_path: str, logger: Optional[logging.Logger] = None)
         raise DataValidationError(f"Excel file is corrupted or cannot be read: {e}") from e
 
 
-def validate_date_range(df: pd.DataFrame, logger: Optional[logging.Logger] = None) -> None:
+def validate_date_range(df: pd.DataFrame, logger: Optional[logging.Logger] = None) -> Tuple[pd.Timestamp, pd.Timestamp]:
     """
     Validate date range in the DataFrame.
 
@@ -143,6 +165,9 @@ def validate_date_range(df: pd.DataFrame, logger: Optional[logging.Logger] = Non
     df (pd.DataFrame): DataFrame with 'Date' column
     logger (logging.Logger, optional): Logger instance for logging messages
 
+    Returns:
+    tuple: The earliest and latest dates, so callers need not scan the column again.
+
     Raises:
     DataValidationError: If date range is invalid (missing Date column,
                         no valid dates, NaT values, or all future dates)
@@ -168,12 +193,13 @@ def validate_date_range(df: pd.DataFrame, logger: Optional[logging.Logger] = Non
     today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
     if start_date > today:
         plog.log_error(logger, f"Data contains only future dates. Start date: {start_date}, Today: {today}")
-        raise DataValidationError(f"Data contains only future dates. Start date: {start_date.strftime('%Y-%m-%d')}")
+        raise DataValidationError(f"Data contains only future dates. Start date: {start_date.date().isoformat()}")
 
     # Log date range info
     plog.log_info(
-        logger, f"Date range validation passed. Start: {start_date.strftime('%Y-%m-%d')}, End: {end_date.strftime('%Y-%m-%d')}"
+        logger, f"Date range validation passed. Start: {start_date.date().isoformat()}, End: {end_date.date().isoformat()}"
     )
+    return start_date, end_date
 
 
 def find_column_name(df_columns: pd.Index, expected_name: str) -> Optional[str]:
@@ -252,16 +278,21 @@ def chronological_train_test_split(
     # Validate strictly increasing chronological order (no duplicate dates).
     # The upstream pipeline (preprocess_and_append_csv / _process_dataframe)
     # guarantees one row per date via drop_duplicates + date-range reindexing.
-    # We validate both invariants here as a defensive check.
+    # We validate both invariants here as a defensive check, reading both off one
+    # pass over the steps between consecutive dates: a negative step means out of
+    # order and a zero step a duplicate date. Missing dates (NaT) count as out of
+    # order, as they do for is_monotonic_increasing.
     dates = processed_df["Date"]
-    if not dates.is_monotonic_increasing:
-        plog.log_error(logger, "Data is not in chronological order. Cannot perform time-aware split.")
-        raise DataValidationError(
-            "Data is not in chronological order. "
-            "Ensure data is sorted by date before splitting."
-        )
-
-    if not dates.is_unique:
+    date_values = dates.to_numpy(dtype="datetime64[ns]")
+    has_nat = np.isnat(date_values).any()
+    steps = np.diff(date_values.view(np.int64))
+    if has_nat or not (steps > 0).all():
+        if has_nat or (steps < 0).any():
+            plog.log_error(logger, "Data is not in chronological order. Cannot perform time-aware split.")
+            raise DataValidationError(
+                "Data is not in chronological order. "
+                "Ensure data is sorted by date before splitting."
+            )
         plog.log_error(logger, "Data contains duplicate dates. Each date must have exactly one record.")
         raise DataValidationError(
             "Data contains duplicate dates. The pipeline should aggregate "
@@ -279,10 +310,10 @@ def chronological_train_test_split(
     y_test = y.iloc[split_idx:]
 
     # Log date boundaries
-    train_start = dates.iloc[0].strftime("%Y-%m-%d")
-    train_end = dates.iloc[split_idx - 1].strftime("%Y-%m-%d")
-    test_start = dates.iloc[split_idx].strftime("%Y-%m-%d")
-    test_end = dates.iloc[-1].strftime("%Y-%m-%d")
+    train_start = dates.iloc[0].date().isoformat()
+    train_end = dates.iloc[split_idx - 1].date().isoformat()
+    test_start = dates.iloc[split_idx].date().isoformat()
+    test_end = dates.iloc[-1].date().isoformat()
 
     plog.log_info(
         logger,
@@ -337,6 +368,10 @@ def validate_minimum_data(
     plog.log_info(logger, f"Data validation passed: {total_samples} total samples, ~{expected_test_samples} test samples")
 
 
+# Last (month, day) of each calendar quarter
+_QUARTER_END_MONTH_DAY = ((3, 31), (6, 30), (9, 30), (12, 31))
+
+
 def get_quarter_end_date(current_date: datetime) -> datetime:
     """
     Get the end date of the current quarter based on the provided date.
@@ -347,12 +382,15 @@ def get_quarter_end_date(current_date: datetime) -> datetime:
     Returns:
     datetime: The end date of the current quarter.
     """
-    quarter = (current_date.month - 1) // 3 + 1
-    return datetime(current_date.year, 3 * quarter, 1) + DateOffset(months=1) - DateOffset(days=1)
+    month, day = _QUARTER_END_MONTH_DAY[(current_date.month - 1) // 3]
+    return datetime(current_date.year, month, day)
 
 
 def get_training_date_range(
-    df: pd.DataFrame, date_column: str = "Date", logger: Optional[logging.Logger] = None
+    df: pd.DataFrame,
+    date_column: str = "Date",
+    logger: Optional[logging.Logger] = None,
+    start_date: Optional[datetime] = None,
 ) -> pd.DatetimeIndex:
     """
     Get the complete date range for training data.
@@ -369,6 +407,8 @@ def get_training_date_range(
     df (pd.DataFrame): DataFrame containing the date column
     date_column (str): Name of the date column (default: 'Date')
     logger (logging.Logger, optional): Logger instance for logging messages
+    start_date (datetime, optional): Earliest date in the data if already known
+                                     (e.g. from ``validate_date_range``); skips the scan of the column
 
     Returns:
     pd.DatetimeIndex: Complete date range for training from earliest date to yesterday
@@ -387,7 +427,8 @@ def get_training_date_range(
     end_date = end_date.replace(hour=0, minute=0, second=0, microsecond=0)
 
     # Get start date from data
-    start_date = df[date_column].min()
+    if start_date is None:
+        start_date = df[date_column].min()
 
     # Validate dates
     if pd.isna(start_date) or pd.isna(end_date):
@@ -397,12 +438,91 @@ def get_training_date_range(
     # Log the range
     plog.log_info(
         logger,
-        f"Creating complete date range from {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}",
+        f"Creating complete date range from {start_date.date().isoformat()} to {end_date.date().isoformat()}",
     )
 
     return pd.date_range(start=start_date, end=end_date)
 
 
+def _fill_missing_dates(df: pd.DataFrame, date_range: pd.DatetimeIndex) -> pd.DataFrame:
+    """
+    Align a DataFrame to a complete date range (internal helper function).
+
+    Equivalent to ``set_index("Date").reindex(date_range)`` followed by filling
+    missing transaction amounts with 0, but gathers each column once by
+    position instead of building the intermediate indexed frames.
+
+    Parameters:
+    df (pd.DataFrame): DataFrame with unique 'Date' values.
+    date_range (pd.DatetimeIndex): Dates the result should contain, in order.
+
+    Returns:
+    pd.DataFrame: One row per date in ``date_range``, 'Date' first.
+    """
+    positions = pd.Index(df["Date"]).get_indexer(date_range)
+    columns: Dict[str, Any] = {"Date": date_range}
+    for column in df.columns.drop("Date"):
+        values = pd.api.extensions.take(df[column].to_numpy(), positions, allow_fill=True)
+        if column == TRANSACTION_AMOUNT_LABEL:
+            values[pd.isna(values)] = 0
+        columns[column] = values
+    return pd.DataFrame(columns)
+
+
+# Day-first formats with two-digit years, as used by bank statement exports, which
+# ``guess_datetime_format`` cannot resolve on its own.
+_DAYFIRST_SHORT_YEAR_FORMATS = ("%d/%m/%y", "%d-%m-%y", "%d.%m.%y", "%d %m %y")
+
+
+def _guess_dayfirst_format(sample: str) -> Optional[str]:
+    """Return a strptime format for a day-first date string, or None if none fits."""
+    date_format = guess_datetime_format(sample, dayfirst=True)
+    if date_format is not None:
+        return date_format
+    for candidate in _DAYFIRST_SHORT_YEAR_FORMATS:
+        try:
+            datetime.strptime(sample, candidate)
+        except ValueError:
+            continue
+        return candidate
+    return None
+
+
+def _parse_dayfirst_dates(values: pd.Series) -> pd.Series:
+    """
+    Convert a column of day-first dates to datetimes (internal helper function).
+
+    Columns that are already datetimes are returned unchanged. Otherwise the
+    text values are stripped, the format is guessed once from the first
+    non-null value and passed to ``pd.to_datetime`` explicitly, so every value
+    goes through the same vectorised parser. Values that do not match the
+    guessed format (for example a four-digit year among two-digit ones) are
+    parsed again with ``dayfirst=True`` inference, which is also used for the
+    whole column when no format can be guessed. Values that cannot be parsed
+    become NaT.
+
+    Parameters:
+    values (pd.Series): Dates as datetimes, strings or a mix of both.
+
+    Returns:
+    pd.Series: The dates as datetime64 values.
+    """
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    first_valid = values.first_valid_index()
+    sample = values[first_valid] if first_valid is not None else None
+    date_format = _guess_dayfirst_format(sample.strip()) if isinstance(sample, str) else None
+    if date_format is None:
+        return pd.to_datetime(values, dayfirst=True, errors="coerce")
+    # Strip padding the explicit format would reject; non-text values are kept as they are
+    values = values.str.strip().fillna(values)
+    parsed = pd.to_datetime(values, format=date_format, errors="coerce")
+    unmatched = parsed.isna() & values.notna()
+    if unmatched.any():
+        parsed[unmatched] = pd.to_datetime(values[unmatched], dayfirst=True, errors="coerce")
+    return parsed
+
+
 def _process_dataframe(
     df: pd.DataFrame, logger: Optional[logging.Logger] = None
 ) -> Tuple[pd.DataFrame, pd.Series, pd.DataFrame]:
@@ -419,48 +539,50 @@ def _process_dataframe(
     Returns:
     tuple: A tuple containing X_train, y_train, and the processed DataFrame.
     """
-    if not pd.to_numeric(df[TRANSACTION_AMOUNT_LABEL], errors="coerce").notnull().all():
+    # Convert once and validate the converted column; already-numeric columns
+    # (e.g. a CSV read with a float dtype) need only the missing-value check.
+    amounts = df[TRANSACTION_AMOUNT_LABEL]
+    if not pd.api.types.is_numeric_dtype(amounts):
+        amounts = pd.to_numeric(amounts, errors="coerce")
+    if amounts.isna().any():
         plog.log_error(logger, f"The '{TRANSACTION_AMOUNT_LABEL}' column contains non-numeric values")
         raise DataValidationError(
             f"The '{TRANSACTION_AMOUNT_LABEL}' column contains non-numeric values. Please check the data."
         )
 
     plog.log_info(logger, "Converting transaction amounts to numeric values")
-    df[TRANSACTION_AMOUNT_LABEL] = pd.to_numeric(df[TRANSACTION_AMOUNT_LABEL])
+    df[TRANSACTION_AMOUNT_LABEL] = amounts
     df = df.dropna(subset=["Date"])
-    df["Date"] = pd.to_datetime(df["Date"], dayfirst=True, errors="coerce")
+    df["Date"] = _parse_dayfirst_dates(df["Date"])
     df = df.dropna(subset=["Date"])
     df = df.drop_duplicates(subset=["Date"], keep="last")
     plog.log_info(logger, f"Data cleaning completed. Rows after cleaning: {len(df)}")
 
     # Validate date range
-    validate_date_range(df, logger=logger)
+    start_date, _ = validate_date_range(df, logger=logger)
 
     # Use helper function to get complete date range for training
-    complete_date_range = get_training_date_range(df, logger=logger)
-    df = (df.set_index("Date")
-            .reindex(complete_date_range)
-            .fillna({TRANSACTION_AMOUNT_LABEL: 0})
-            .reset_index()
-            .rename(columns={"index": "Date"}))
+    complete_date_range = get_training_date_range(df, logger=logger, start_date=start_date)
+    df = _fill_missing_dates(df, complete_date_range)
     plog.log_info(logger, f"Date range filled. Total rows: {len(df)}")
 
     plog.log_info(logger, "Engineering features: day of week, month, day of month")
-    df[DAY_OF_WEEK] = df["Date"].dt.day_name()
-    df["Month"] = df["Date"].dt.month
-    df["Day of the Month"] = df["Date"].dt.day
+    df["Month"] = df["Date"].dt.month.astype(np.int8)
+    df["Day of the Month"] = df["Date"].dt.day.astype(np.int8)
 
     # Time-series feature engineering (lags, rolling stats, calendar)
     ts_config = config.get("feature_engineering", {})
     if ts_config.get("enabled", True):
         df = generate_timeseries_features(df, ts_config, logger=logger, drop_na=False)
 
-    df = pd.get_dummies(df, columns=[DAY_OF_WEEK], drop_first=True)
+    df = generate_day_of_week_features(df, encoding=ts_config.get("day_of_week_encoding", "onehot"))
     plog.log_info(logger, f"Feature engineering completed. Total features: {len(df.columns) - 2}")
 
     # Drop rows with NaN values introduced by lag/rolling features.
     # This must happen after all feature engineering so that X, y, and df stay aligned.
-    nan_mask = df.drop(columns=["Date", TRANSACTION_AMOUNT_LABEL]).isna().any(axis=1)
+    # Date and the validated, zero-filled target never hold NaN, so the whole
+    # frame can be scanned without first copying out the feature columns.
+    nan_mask = df.isna().any(axis=1)
     if nan_mask.any():
         rows_before = len(df)
         df = df[~nan_mask].reset_index(drop=True)
@@ -476,6 +598,53 @@ def _process_dataframe(
     return x_train, y_train, df
 
 
+def _read_transactions_csv(file_path: str, logger: Optional[logging.Logger] = None) -> pd.DataFrame:
+    """
+    Read a transaction CSV with the amount and date types declared up front (internal helper function).
+
+    Only the Date and amount columns are loaded; any other columns in the file
+    are skipped by the parser rather than read and carried through as features.
+    Amounts are parsed straight to float64 and dates in the DD/MM/YYYY format
+    written by ``update_data_file`` straight to datetimes, so no inference pass
+    or later conversion is needed. If any date does not match that format the
+    column is left as text and parsed by ``_process_dataframe`` as before.
+
+    Parameters:
+    file_path (str): Path to the CSV file.
+    logger (logging.Logger, optional): Logger instance for logging messages.
+
+    Returns:
+    pd.DataFrame: The CSV contents.
+
+    Raises:
+    DataValidationError: If the CSV is malformed, lacks the Date or amount column,
+                        or the transaction amount column contains non-numeric values.
+    """
+    required_columns = ["Date", TRANSACTION_AMOUNT_LABEL]
+    try:
+        return pd.read_csv(
+            file_path,
+            usecols=required_columns,
+            dtype={TRANSACTION_AMOUNT_LABEL: "float64"},
+            parse_dates=["Date"],
+            date_format="%d/%m/%Y",
+        )
+    except pd.errors.ParserError as e:
+        # ParserError subclasses ValueError, so it must be handled first
+        plog.log_error(logger, f"CSV file parsing error: {e}")
+        raise DataValidationError(f"CSV file is not properly formatted: {e}") from e
+    except ValueError as e:
+        if "Usecols do not match columns" in str(e):
+            plog.log_error(logger, f"Missing required columns in CSV: {e}")
+            raise DataValidationError(f"Missing required columns in CSV file. Expected: {required_columns}. {e}") from e
+        if "could not convert string to float" not in str(e):
+            raise
+        plog.log_error(logger, f"The '{TRANSACTION_AMOUNT_LABEL}' column contains non-numeric values")
+        raise DataValidationError(
+            f"The '{TRANSACTION_AMOUNT_LABEL}' column contains non-numeric values. Please check the data."
+        ) from e
+
+
 def preprocess_data(file_path: str, logger: Optional[logging.Logger] = None) -> Tuple[pd.DataFrame, pd.Series, pd.DataFrame]:
     """
     Preprocess input data from a CSV file.
@@ -490,7 +659,7 @@ def preprocess_data(file_path: str, logger: Optional[logging.Logger] = None) ->
     # Validate CSV file before reading
     validate_csv_file(file_path, logger=logger)
 
-    df = pd.read_csv(file_path)
+    df = _read_transactions_csv(file_path, logger=logger)
     return _process_dataframe(df, logger=logger)
 
 
@@ -527,13 +696,14 @@ def prepare_future_dates(
     future_dates = pd.date_range(start=start_date, end=end_date)
     future_df = pd.DataFrame({"Date": future_dates})
 
-    future_df[DAY_OF_WEEK] = future_df["Date"].dt.day_name().astype("category")
-    future_df["Month"] = future_df["Date"].dt.month
-    future_df["Day of the Month"] = future_df["Date"].dt.day
-    future_df = pd.get_dummies(future_df, columns=[DAY_OF_WEEK], drop_first=True)
-
-    # Time-series features from historical data (after one-hot encoding)
+    future_df["Month"] = future_df["Date"].dt.month.astype(np.int8)
+    future_df["Day of the Month"] = future_df["Date"].dt.day.astype(np.int8)
     ts_config = config.get("feature_engineering", {})
+    future_df = generate_day_of_week_features(
+        future_df, encoding=ts_config.get("day_of_week_encoding", "onehot")
+    )
+
+    # Time-series features from historical data (after day-of-week encoding)
     if ts_config.get("enabled", True) and historical_df is not None:
         ts_features = prepare_future_timeseries_features(
             historical_df, future_df, ts_config, logger=logger,
@@ -560,68 +730,72 @@ def _read_and_process_excel_data(excel_path: str, logger: Optional[logging.Logge
     Raises:
     DataValidationError: If required columns are missing or dependencies are not installed.
     """
-    # Validate Excel file before reading
-    validate_excel_file(excel_path, logger=logger)
-
-    try:
-        engine = "xlrd" if excel_path.endswith(".xls") else "openpyxl"
-        sheet_names = pd.ExcelFile(excel_path, engine=engine).sheet_names
+    # Validate Excel file before reading; the workbook opened there is reused so it is parsed only once
+    with _open_excel_file(excel_path, logger=logger) as excel_file:
+        sheet_names = excel_file.sheet_names
         plog.log_info(logger, f"Available sheets: {sheet_names}")
 
+        # Read the header row alone first so that only the three columns used
+        # below are materialised when the sheet itself is read
         skiprows = config["data_processing"]["skiprows"]
-        excel_data = pd.read_excel(excel_path, sheet_name=sheet_names[0], engine=engine, skiprows=skiprows)
-    except ImportError as e:
-        # Missing openpyxl dependency for .xlsx files
-        if "openpyxl" in str(e):
-            plog.log_error(logger, f"Missing openpyxl dependency for .xlsx file processing: {e}")
-            raise DataValidationError(
-                "Processing .xlsx files requires openpyxl. Install it with: pip install openpyxl"
-            ) from e
-        # Other import errors
-        plog.log_error(logger, f"Missing dependency for Excel file processing: {e}")
-        raise DataValidationError(f"Missing required dependency for Excel processing: {e}") from e
-
-    excel_data.columns = excel_data.columns.str.strip()
-    plog.log_info(logger, f"Columns in the sheet: {excel_data.columns.tolist()}")
-
-    # Find and validate required columns
-    value_date_col = find_column_name(excel_data.columns, VALUE_DATE_LABEL)
-    if value_date_col is None:
-        plog.log_error(logger, f"{VALUE_DATE_LABEL} column not found. Available columns: {excel_data.columns.tolist()}")
-        raise DataValidationError(
-            f"{VALUE_DATE_LABEL} column not found in Excel file. Available columns: {excel_data.columns.tolist()}"
+        header = excel_file.parse(sheet_name=sheet_names[0], skiprows=skiprows, nrows=0).columns
+        columns = header.str.strip()
+        plog.log_info(logger, f"Columns in the sheet: {columns.tolist()}")
+
+        # Find and validate required columns
+        value_date_col = find_column_name(columns, VALUE_DATE_LABEL)
+        if value_date_col is None:
+            available = columns.tolist()
+            plog.log_error(logger, f"{VALUE_DATE_LABEL} column not found. Available columns: {available}")
+            raise DataValidationError(f"{VALUE_DATE_LABEL} column not found in Excel file. Available columns: {available}")
+        plog.log_info(logger, f"Using '{value_date_col}' as {VALUE_DATE_LABEL} column")
+
+        # Find withdrawal and deposit columns
+        withdrawal_col = find_column_name(columns, "Withdrawal Amount (INR )")
+        deposit_col = find_column_name(columns, "Deposit Amount (INR )")
+
+        if withdrawal_col is None or deposit_col is None:
+            available = columns.tolist()
+            plog.log_error(
+                logger,
+                f"Required columns not found. Expected: 'Withdrawal Amount (INR )' and 'Deposit Amount (INR )'. "
+                f"Found: {available}",
+            )
+            raise DataValidationError(f"Required columns not found in Excel file. Available columns: {available}")
+
+        # Select by position: statement exports can repeat a header label, which
+        # would make a name-based selection ambiguous. Each name is taken from its
+        # first occurrence, and the columns come back in sheet order.
+        names_by_position = sorted(
+            (int(np.flatnonzero(columns == col)[0]), col) for col in (value_date_col, withdrawal_col, deposit_col)
+        )
+        excel_data = excel_file.parse(
+            sheet_name=sheet_names[0], skiprows=skiprows, usecols=[position for position, _ in names_by_position]
         )
 
-    plog.log_info(logger, f"Using '{value_date_col}' as {VALUE_DATE_LABEL} column")
-    excel_data[value_date_col] = pd.to_datetime(excel_data[value_date_col], dayfirst=True, errors="coerce")
+    excel_data.columns = [col for _, col in names_by_position]
+    excel_data[value_date_col] = _parse_dayfirst_dates(excel_data[value_date_col])
     excel_data = excel_data.dropna(subset=[value_date_col])
 
     # Rename to standard VALUE_DATE_LABEL for consistency
     if value_date_col != VALUE_DATE_LABEL:
         excel_data = excel_data.rename(columns={value_date_col: VALUE_DATE_LABEL})
 
-    # Find withdrawal and deposit columns
-    withdrawal_col = find_column_name(excel_data.columns, "Withdrawal Amount (INR )")
-    deposit_col = find_column_name(excel_data.columns, "Deposit Amount (INR )")
-
-    if withdrawal_col is None or deposit_col is None:
-        plog.log_error(
-            logger,
-            f"Required columns not found. Expected: 'Withdrawal Amount (INR )' and 'Deposit Amount (INR )'. "
-            f"Found: {excel_data.columns.tolist()}",
-        )
-        raise DataValidationError(
-            f"Required columns not found in Excel file. Available columns: {excel_data.columns.tolist()}"
-        )
-
     plog.log_info(logger, f"Using columns: '{withdrawal_col}' for withdrawals and '{deposit_col}' for deposits")
 
     # Calculate net expense and aggregate by date
-    excel_data["expense"] = excel_data[withdrawal_col].fillna(0) * -1 + excel_data[deposit_col].fillna(0)
-    daily_expenses = excel_data.groupby(VALUE_DATE_LABEL)["expense"].sum().reset_index()
-    daily_expenses.columns = ["Date", TRANSACTION_AMOUNT_LABEL]
+    try:
+        withdrawals = excel_data[withdrawal_col].to_numpy(dtype=np.float64, na_value=0.0)
+        deposits = excel_data[deposit_col].to_numpy(dtype=np.float64, na_value=0.0)
+    except (TypeError, ValueError) as e:
+        plog.log_error(logger, f"Withdrawal or deposit amounts in the Excel file are not numeric: {e}")
+        raise DataValidationError(f"Withdrawal or deposit amounts in the Excel file are not numeric: {e}") from e
+    # Sum the net expense per value date: np.unique gives the sorted dates and each
+    # row's position among them, and bincount adds the amounts into those slots
+    dates, positions = np.unique(excel_data[VALUE_DATE_LABEL].to_numpy(), return_inverse=True)
+    daily_totals = np.bincount(positions, weights=deposits - withdrawals, minlength=len(dates))
 
-    return daily_expenses
+    return pd.DataFrame({"Date": dates, TRANSACTION_AMOUNT_LABEL: daily_totals})
 
 
 def preprocess_and_append_csv(
@@ -648,7 +822,7 @@ def preprocess_and_append_csv(
     # Validate CSV file before reading
     validate_csv_file(file_path, logger=logger)
 
-    df = pd.read_csv(file_path)
+    df = _read_transactions_csv(file_path, logger=logger)
 
     # Process and merge Excel data if provided
     if excel_path:
@@ -656,7 +830,7 @@ def preprocess_and_append_csv(
         df = pd.concat([df, daily_expenses], ignore_index=True)
 
     df = df.dropna(subset=["Date"])
-    df["Date"] = pd.to_datetime(df["Date"], dayfirst=True, errors="coerce")
+    df["Date"] = _parse_dayfirst_dates(df["Date"])
     # Drop any NaT values created by failed datetime conversion
     df = df.dropna(subset=["Date"])
     df = df.drop_duplicates(subset=["Date"], keep="last")
@@ -664,18 +838,14 @@ def preprocess_and_append_csv(
 
     # Use helper function to get complete date range for training
     complete_date_range = get_training_date_range(df, logger=logger)
-    df = (df.set_index("Date")
-            .reindex(complete_date_range)
-            .fillna({TRANSACTION_AMOUNT_LABEL: 0})
-            .reset_index()
-            .rename(columns={"index": "Date"}))
+    df = _fill_missing_dates(df, complete_date_range)
 
     # If Excel data was provided, save the merged data with complete date range for CSV update
     raw_merged_df = None
     if excel_path:
         # Use the df with complete date range (all dates filled with 0 for missing)
         raw_merged_df = df[["Date", TRANSACTION_AMOUNT_LABEL]].copy()
-        plog.log_info(logger, f"Raw merged data contains {len(raw_merged_df)} records from {raw_merged_df['Date'].min().strftime('%Y-%m-%d')} to {raw_merged_df['Date'].max().strftime('%Y-%m-%d')}")
+        plog.log_info(logger, f"Raw merged data contains {len(raw_merged_df)} records from {raw_merged_df['Date'].min().date().isoformat()} to {raw_merged_df['Date'].max().date().isoformat()}")
 
     # Process the dataframe and return with raw merged data
     x_train, y_train, processed_df = _process_dataframe(df, logger=logger)
@@ -712,12 +882,11 @@ def write_predictions(
             plog.log_info(logger, f"Skipped writing to {output_path}")
             return
 
-    # Create a copy for output formatting
-    output_df = predicted_df.copy()
-
-    # Format Date column if it exists and is datetime type
+    # Format Date column if it exists and is datetime type. Sanitization below
+    # returns a new frame, so the input only needs copying to replace the dates.
+    output_df = predicted_df
     if "Date" in output_df.columns and pd.api.types.is_datetime64_any_dtype(output_df["Date"]):
-        output_df["Date"] = output_df["Date"].dt.strftime("%d/%m/%Y")
+        output_df = output_df.assign(Date=output_df["Date"].dt.strftime("%d/%m/%Y"))
 
     # Sanitize data to prevent CSV injection
     plog.log_info(logger, "Sanitizing data to prevent CSV injection")
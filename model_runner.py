@@ -53,8 +53,12 @@ from sklearn.tree import DecisionTreeRegressor
 import python_logging_framework as plog
 from baselines import run_baselines, write_comparison_report
 from config import config
-from constants import DAY_OF_WEEK, TRANSACTION_AMOUNT_LABEL
-from feature_engineering import prepare_future_timeseries_features, save_feature_list
+from constants import TRANSACTION_AMOUNT_LABEL
+from feature_engineering import (
+    generate_day_of_week_features,
+    prepare_future_timeseries_features,
+    save_feature_list,
+)
 from helpers import (
     apply_target_transform,
     calculate_median_absolute_error,
@@ -785,10 +789,11 @@ def _build_single_day_features(
 ) -> pd.DataFrame:
     """Create a single future feature row using recursive history-aware features."""
     single_day = pd.DataFrame({"Date": [date]})
-    single_day[DAY_OF_WEEK] = single_day["Date"].dt.day_name().astype("category")
-    single_day["Month"] = single_day["Date"].dt.month
-    single_day["Day of the Month"] = single_day["Date"].dt.day
-    single_day = pd.get_dummies(single_day, columns=[DAY_OF_WEEK], drop_first=True)
+    single_day["Month"] = single_day["Date"].dt.month.astype(np.int8)
+    single_day["Day of the Month"] = single_day["Date"].dt.day.astype(np.int8)
+    single_day = generate_day_of_week_features(
+        single_day, encoding=ts_config.get("day_of_week_encoding", "onehot")
+    )
 
     ts_features = prepare_future_timeseries_features(history, single_day, ts_config)
     ts_cols = [c for c in ts_features.columns if c not in single_day.columns]
@@ -1481,6 +1486,7 @@ def main(args: Optional[List[str]] = None) -> int:
             skip_confirmation=parsed_args.skip_confirmation,
             rolling_windows_months=config["baselines"]["rolling_windows_months"],
             logger=logger,
+            rolling_engine=config["baselines"].get("rolling_engine", "cython"),
         )
     else:
         plog.log_info(logger, "Baseline forecasts disabled via config or CLI flag.")
@@ -0,0 +1,455 @@
+"""
+Unit tests for the baselines module.
+
+Tests cover the baseline predictors used for in-sample evaluation and the
+forecast helpers used to produce future baseline predictions.
+"""
+
+import os
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.tseries.offsets import DateOffset
+from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+
+from baselines import (
+    _build_baseline_configs,
+    _ensure_series_with_dates,
+    _filter_valid,
+    _predict_baselines,
+    _split_positions,
+    last_value_predictions,
+    rolling_mean_forecast,
+    rolling_mean_predictions,
+    run_baselines,
+    seasonal_naive_forecast,
+    seasonal_naive_predictions,
+    write_comparison_report,
+)
+
+
+@pytest.fixture
+def daily_series():
+    """Create a daily expense series with gaps and a missing value."""
+    rng = np.random.default_rng(42)
+    dates = pd.date_range("2022-01-31", "2024-03-31", freq="D")
+    dates = dates[rng.random(len(dates)) > 0.3]
+    series = pd.Series(rng.uniform(0, 200, size=len(dates)), index=dates)
+    series.iloc[5] = np.nan
+    return series
+
+
+def _reference_rolling_mean(series, window_months):
+    """Reference implementation: mean of history in [date - window_months, date)."""
+    predictions = []
+    for current_date in series.index:
+        start_date = current_date - DateOffset(months=window_months)
+        history = series.loc[(series.index >= start_date) & (series.index < current_date)]
+        predictions.append(history.mean() if not history.empty else np.nan)
+    return pd.Series(predictions, index=series.index)
+
+
+class TestEnsureSeriesWithDates:
+    """Tests for _ensure_series_with_dates."""
+
+    def test_datetime_dates(self):
+        dates = pd.Series(pd.date_range("2024-01-01", periods=3, freq="D"))
+        result = _ensure_series_with_dates(pd.Series([1.0, 2.0, 3.0]), dates)
+        pd.testing.assert_index_equal(result.index, pd.DatetimeIndex(dates))
+        assert result.name == "Tran Amt"
+        assert result.tolist() == [1.0, 2.0, 3.0]
+
+    def test_string_dates_are_parsed(self):
+        dates = pd.Series(["2024-01-01", "2024-01-02", "2024-01-03"])
+        result = _ensure_series_with_dates(pd.Series([1.0, 2.0, 3.0]), dates)
+        pd.testing.assert_index_equal(result.index, pd.DatetimeIndex(pd.to_datetime(dates)))
+
+    def test_unsorted_dates_are_sorted(self):
+        dates = pd.Series(pd.to_datetime(["2024-01-03", "2024-01-01", "2024-01-02"]))
+        result = _ensure_series_with_dates(pd.Series([3.0, 1.0, 2.0]), dates)
+        assert result.index.is_monotonic_increasing
+        assert result.tolist() == [1.0, 2.0, 3.0]
+
+    def test_length_mismatch_raises(self):
+        dates = pd.Series(pd.date_range("2024-01-01", periods=2, freq="D"))
+        with pytest.raises(ValueError, match="Series length must match dates length"):
+            _ensure_series_with_dates(pd.Series([1.0, 2.0, 3.0]), dates)
+
+
+class TestBuildBaselineConfigs:
+    """Tests for _build_baseline_configs."""
+
+    @staticmethod
+    def _keys(days, mock_logger):
+        series = pd.Series(1.0, index=pd.date_range("2023-01-01", periods=days, freq="D"))
+        future_dates = pd.date_range("2025-01-01", periods=3, freq="D")
+        return [config["key"] for config in _build_baseline_configs([3, 6], future_dates, series, mock_logger)]
+
+    def test_seasonal_naive_included_with_a_year_of_history(self, mock_logger):
+        assert self._keys(366, mock_logger) == [
+            "naive_last_value",
+            "rolling_mean_3m",
+            "rolling_mean_6m",
+            "seasonal_naive_yoy",
+        ]
+
+    def test_seasonal_naive_skipped_with_short_history(self, mock_logger):
+        assert "seasonal_naive_yoy" not in self._keys(365, mock_logger)
+
+
+class TestSplitPositions:
+    """Tests for _split_positions."""
+
+    @pytest.fixture
+    def series(self):
+        return pd.Series(np.arange(10, dtype=float), index=pd.date_range("2024-01-01", periods=10, freq="D"))
+
+    def test_contiguous_split_returns_slice(self, series):
+        positions = _split_positions(series, series.index[3:8])
+        assert positions == slice(3, 8)
+
+    def test_empty_split_returns_empty_slice(self, series):
+        positions = _split_positions(series, series.index[:0])
+        assert series.to_numpy()[positions].size == 0
+
+    def test_non_contiguous_split_returns_positions(self, series):
+        positions = _split_positions(series, series.index[[1, 4, 6]])
+        np.testing.assert_array_equal(positions, [1, 4, 6])
+
+    def test_missing_date_raises(self, series):
+        with pytest.raises(ValueError, match="Split dates must be present"):
+            _split_positions(series, pd.DatetimeIndex(["2023-12-31"]))
+
+
+class TestLastValuePredictions:
+    """Tests for last_value_predictions."""
+
+    def test_matches_shift(self, daily_series):
+        result = last_value_predictions(daily_series)
+        pd.testing.assert_series_equal(result, daily_series.shift(1))
+
+    def test_integer_series_is_float(self):
+        series = pd.Series([1, 2, 3], index=pd.date_range("2024-01-01", periods=3, freq="D"))
+        result = last_value_predictions(series)
+        assert result.dtype == np.float64
+        assert np.isnan(result.iloc[0])
+        assert result.iloc[2] == 2.0
+
+    def test_empty_series(self):
+        series = pd.Series([], index=pd.DatetimeIndex([]), dtype=float)
+        assert last_value_predictions(series).empty
+
+
+class TestRollingMeanPredictions:
+    """Tests for rolling_mean_predictions."""
+
+    @pytest.mark.parametrize("window_months", [1, 3, 6])
+    def test_matches_calendar_month_window(self, daily_series, window_months):
+        result = rolling_mean_predictions(daily_series, window_months)
+        expected = _reference_rolling_mean(daily_series, window_months)
+        pd.testing.assert_series_equal(result, expected)
+
+    def test_first_value_is_nan(self, daily_series):
+        result = rolling_mean_predictions(daily_series, 3)
+        assert np.isnan(result.iloc[0])
+
+    def test_numba_engine_matches_cython(self, daily_series):
+        pytest.importorskip("numba")
+        result = rolling_mean_predictions(daily_series, 3, engine="numba")
+        expected = rolling_mean_predictions(daily_series, 3)
+        pd.testing.assert_series_equal(result, expected)
+
+    def test_excludes_current_value(self):
+        series = pd.Series([10.0, 20.0, 30.0], index=pd.date_range("2024-01-01", periods=3, freq="D"))
+        result = rolling_mean_predictions(series, 1)
+        assert result.iloc[1] == 10.0
+        assert result.iloc[2] == 15.0
+
+
+class TestSeasonalNaivePredictions:
+    """Tests for seasonal_naive_predictions."""
+
+    def test_uses_value_from_prior_year(self):
+        dates = pd.date_range("2023-01-01", "2024-12-31", freq="D")
+        series = pd.Series(np.arange(len(dates), dtype=float), index=dates)
+        result = seasonal_naive_predictions(series, years_back=1)
+        assert result.loc["2024-03-15"] == series.loc["2023-03-15"]
+        assert result.loc["2023-06-01":"2023-12-31"].isna().all()
+
+    def test_missing_prior_date_is_nan(self, daily_series):
+        result = seasonal_naive_predictions(daily_series, years_back=1)
+        for current_date, value in result.items():
+            prior_date = current_date - DateOffset(years=1)
+            expected = daily_series.get(prior_date, np.nan)
+            assert (np.isnan(value) and np.isnan(expected)) or value == expected
+
+    def test_preserves_index(self, daily_series):
+        result = seasonal_naive_predictions(daily_series, years_back=1)
+        pd.testing.assert_index_equal(result.index, daily_series.index)
+
+
+class TestRollingMeanForecast:
+    """Tests for rolling_mean_forecast."""
+
+    def test_mean_of_trailing_window(self, daily_series):
+        forecast_dates = pd.date_range("2024-04-01", periods=4, freq="D")
+        result = rolling_mean_forecast(daily_series, forecast_dates, 3)
+        window = daily_series.loc[daily_series.index >= daily_series.index.max() - DateOffset(months=3)]
+        np.testing.assert_allclose(result, np.full(4, window.mean()))
+
+    def test_window_longer_than_history(self):
+        series = pd.Series([10.0, 20.0, 30.0], index=pd.date_range("2024-01-01", periods=3, freq="D"))
+        result = rolling_mean_forecast(series, pd.date_range("2024-01-04", periods=2, freq="D"), 6)
+        np.testing.assert_array_equal(result, [20.0, 20.0])
+
+    def test_empty_series(self):
+        series = pd.Series([], index=pd.DatetimeIndex([]), dtype=float)
+        result = rolling_mean_forecast(series, pd.date_range("2024-01-01", periods=2, freq="D"), 3)
+        assert np.isnan(result).all()
+
+
+class TestSeasonalNaiveForecast:
+    """Tests for seasonal_naive_forecast."""
+
+    @pytest.fixture
+    def history(self):
+        dates = pd.date_range("2023-01-01", "2024-01-31", freq="D")
+        return pd.Series(np.arange(len(dates), dtype=float), index=dates)
+
+    def test_uses_prior_year_values(self, history):
+        forecast_dates = pd.date_range("2024-02-01", periods=5, freq="D")
+        result = seasonal_naive_forecast(history, forecast_dates)
+        expected = history.loc["2023-02-01":"2023-02-05"].to_numpy()
+        np.testing.assert_array_equal(result, expected)
+
+    def test_large_amounts_keep_two_decimal_precision(self):
+        dates = pd.date_range("2023-01-01", "2024-01-31", freq="D")
+        history = pd.Series(1234567.89, index=dates)
+        result = seasonal_naive_forecast(history, pd.date_range("2024-02-01", periods=2, freq="D"))
+        assert result.dtype == np.float64
+        np.testing.assert_array_equal(np.round(result, 2), [1234567.89, 1234567.89])
+
+    def test_falls_back_to_last_value(self, history):
+        forecast_dates = pd.date_range("2025-06-01", periods=3, freq="D")
+        result = seasonal_naive_forecast(history, forecast_dates)
+        np.testing.assert_array_equal(result, np.full(3, history.iloc[-1]))
+
+    def test_without_fallback_returns_nan(self, history):
+        forecast_dates = pd.date_range("2025-06-01", periods=3, freq="D")
+        result = seasonal_naive_forecast(history, forecast_dates, fallback_to_last=False)
+        assert np.isnan(result).all()
+
+    def test_missing_prior_value_is_not_replaced(self, history):
+        history.loc["2023-02-02"] = np.nan
+        forecast_dates = pd.date_range("2024-02-01", periods=3, freq="D")
+        result = seasonal_naive_forecast(history, forecast_dates)
+        assert np.isnan(result[1])
+        assert result[0] == history.loc["2023-02-01"]
+
+
+class TestFilterValid:
+    """Tests for _filter_valid metric computation."""
+
+    def test_matches_sklearn_metrics(self):
+        rng = np.random.default_rng(0)
+        y_true = pd.Series(rng.uniform(0, 200, size=50))
+        y_pred = pd.Series(rng.uniform(0, 200, size=50))
+        y_pred.iloc[:5] = np.nan
+        y_true.iloc[10] = np.nan
+
+        metrics = _filter_valid(y_true, y_pred)
+
+        mask = y_true.notna() & y_pred.notna()
+        assert metrics["rmse"] == pytest.approx(np.sqrt(mean_squared_error(y_true[mask], y_pred[mask])))
+        assert metrics["mae"] == pytest.approx(mean_absolute_error(y_true[mask], y_pred[mask]))
+        assert metrics["r2"] == pytest.approx(r2_score(y_true[mask], y_pred[mask]))
+
+    def test_returns_none_without_valid_samples(self):
+        y_true = pd.Series([1.0, 2.0])
+        y_pred = pd.Series([np.nan, np.nan])
+        assert _filter_valid(y_true, y_pred) is None
+
+    def test_single_sample_has_nan_r2(self):
+        metrics = _filter_valid(pd.Series([5.0]), pd.Series([3.0]))
+        assert metrics["mae"] == 2.0
+        assert np.isnan(metrics["r2"])
+
+    def test_constant_target_r2_matches_sklearn(self):
+        y_true = pd.Series([4.0, 4.0, 4.0])
+        assert _filter_valid(y_true, pd.Series([4.0, 4.0, 4.0]))["r2"] == r2_score(y_true, [4.0, 4.0, 4.0])
+        assert _filter_valid(y_true, pd.Series([3.0, 4.0, 5.0]))["r2"] == r2_score(y_true, [3.0, 4.0, 5.0])
+
+
+class TestRunBaselines:
+    """Tests for run_baselines."""
+
+    @pytest.fixture
+    def history(self):
+        dates = pd.Series(pd.date_range(end=datetime.now() - timedelta(days=1), periods=400, freq="D").normalize())
+        rng = np.random.default_rng(7)
+        y_full = pd.Series(rng.uniform(0, 200, size=len(dates)))
+        return y_full, dates
+
+    def _run(self, history, temp_dir, mock_logger):
+        y_full, dates = history
+        split_idx = 320
+        future_date = (datetime.now() + timedelta(days=10)).strftime("%d-%m-%Y")
+        return run_baselines(
+            y_full=y_full,
+            processed_dates=dates,
+            train_dates=dates.iloc[:split_idx],
+            test_dates=dates.iloc[split_idx:],
+            future_date_for_function=future_date,
+            output_dir=temp_dir,
+            skip_confirmation=True,
+            rolling_windows_months=[3, 6],
+            logger=mock_logger,
+        )
+
+    def test_returns_metrics_for_each_baseline(self, history, temp_dir, mock_logger):
+        records = self._run(history, temp_dir, mock_logger)
+        assert [record["model"] for record in records] == [
+            "Naive Last Value",
+            "Rolling Mean 3M",
+            "Rolling Mean 6M",
+            "Seasonal Naive (YoY)",
+        ]
+        for record in records:
+            assert record["type"] == "Baseline"
+            assert np.isfinite(record["test_mae"])
+            assert np.isfinite(record["test_rmse"])
+
+    def test_naive_last_value_metrics(self, history, temp_dir, mock_logger):
+        y_full, _ = history
+        records = self._run(history, temp_dir, mock_logger)
+        naive = records[0]
+        test_actual = y_full.iloc[320:].to_numpy()
+        test_pred = y_full.iloc[319:-1].to_numpy()
+        assert naive["test_mae"] == pytest.approx(np.abs(test_actual - test_pred).mean())
+
+    def test_prediction_matrix_rows_match_baselines(self, history, mock_logger):
+        y_full, dates = history
+        series = pd.Series(y_full.to_numpy(), index=pd.DatetimeIndex(dates))
+        future_dates = pd.date_range(datetime.now(), periods=3, freq="D")
+        configs = _build_baseline_configs([3], future_dates, series, mock_logger)
+
+        predictions = _predict_baselines(configs, series)
+
+        assert predictions.shape == (3, len(series))
+        np.testing.assert_array_equal(predictions[0], last_value_predictions(series).to_numpy())
+        np.testing.assert_array_equal(predictions[1], rolling_mean_predictions(series, 3).to_numpy())
+        np.testing.assert_array_equal(predictions[2], seasonal_naive_predictions(series).to_numpy())
+
+    def test_prediction_errors_propagate(self, history):
+        y_full, dates = history
+        series = pd.Series(y_full.to_numpy(), index=pd.DatetimeIndex(dates))
+
+        def failing_predictor(_series):
+            raise RuntimeError("predictor failed")
+
+        configs = [{"name": "Broken", "key": "broken", "pred_func": failing_predictor}]
+        with pytest.raises(RuntimeError, match="predictor failed"):
+            _predict_baselines(configs, series)
+
+    def test_split_dates_missing_from_series_raise(self, history, temp_dir, mock_logger):
+        y_full, dates = history
+        with pytest.raises(ValueError, match="Split dates must be present"):
+            run_baselines(
+                y_full=y_full,
+                processed_dates=dates,
+                train_dates=dates.iloc[:320],
+                test_dates=pd.Series(pd.date_range("1990-01-01", periods=3, freq="D")),
+                future_date_for_function=(datetime.now() + timedelta(days=10)).strftime("%d-%m-%Y"),
+                output_dir=temp_dir,
+                skip_confirmation=True,
+                rolling_windows_months=[3],
+                logger=mock_logger,
+            )
+
+    def test_writes_prediction_files(self, history, temp_dir, mock_logger):
+        self._run(history, temp_dir, mock_logger)
+        for key in ["naive_last_value", "rolling_mean_3m", "rolling_mean_6m", "seasonal_naive_yoy"]:
+            output_path = os.path.join(temp_dir, f"future_predictions_{key}.csv")
+            assert os.path.exists(output_path)
+            predictions = pd.read_csv(output_path)
+            assert list(predictions.columns) == ["Date", "Predicted Tran Amt"]
+            assert len(predictions) == 11
+            values = predictions["Predicted Tran Amt"].to_numpy()
+            np.testing.assert_array_equal(values, np.round(values, 2))
+
+
+class TestWriteComparisonReport:
+    """Tests for write_comparison_report."""
+
+    @pytest.fixture
+    def metrics_records(self):
+        return [
+            {
+                "model": "Naive Last Value",
+                "type": "Baseline",
+                "train_rmse": 60.0,
+                "train_mae": 50.0,
+                "train_r2": -0.5,
+                "test_rmse": 65.0,
+                "test_mae": 55.0,
+                "test_r2": -0.25,
+            },
+            {
+                "model": "Gradient Boosting",
+                "type": "ML",
+                "train_rmse": 20.0,
+                "train_mae": 15.0,
+                "train_r2": 0.8,
+                "test_rmse": 30.0,
+                "test_mae": 25.0,
+                "test_r2": 0.5,
+            },
+            {
+                "model": "Rolling Mean 3M",
+                "type": "Baseline",
+                "train_rmse": np.nan,
+                "train_mae": np.nan,
+                "train_r2": np.nan,
+                "test_rmse": 45.0,
+                "test_mae": 40.0,
+                "test_r2": np.nan,
+            },
+        ]
+
+    def test_empty_records(self, temp_dir, mock_logger):
+        assert write_comparison_report([], temp_dir, mock_logger) == ""
+
+    def test_csv_ranked_by_test_mae(self, metrics_records, temp_dir, mock_logger):
+        csv_path = write_comparison_report(metrics_records, temp_dir, mock_logger)
+        assert csv_path == os.path.join(temp_dir, "reports", "model_comparison_report.csv")
+
+        report = pd.read_csv(csv_path, keep_default_na=False, na_values=[""])
+        assert report["Model"].tolist() == ["Gradient Boosting", "Rolling Mean 3M", "Naive Last Value"]
+        assert report["Test MAE Rank"].tolist() == [1.0, 2.0, 3.0]
+        assert report["R2 Warning"].fillna("").tolist() == ["", "", "NEGATIVE_R2"]
+
+    def test_markdown_summary(self, metrics_records, temp_dir, mock_logger):
+        write_comparison_report(metrics_records, temp_dir, mock_logger)
+        md_path = os.path.join(temp_dir, "reports", "model_comparison_summary.md")
+        with open(md_path, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+
+        assert lines[0] == "# Model Comparison Report"
+        assert lines[2].startswith("**Generated:** ")
+        assert "**Total Models Evaluated:** 3" in lines
+        assert "**Model:** `Gradient Boosting`" in lines
+        assert "- **Test R²:** 0.5000" in lines
+        assert "| 1 | Gradient Boosting | ML | 25.00 | 30.00 | 0.5000 |" in lines
+        assert "| 2 | Rolling Mean 3M | Baseline | 40.00 | 45.00 | N/A |" in lines
+        assert "| 3 | Naive Last Value | Baseline | 55.00 | 65.00 | -0.2500 ⚠️ |" in lines
+        assert "| 1 | Gradient Boosting | ML | 25.00 | 30.00 | 0.5000 | 15.00 | 20.00 | 0.8000 |  |" in lines
+        assert "| 2 | Rolling Mean 3M | Baseline | 40.00 | 45.00 | N/A | N/A | N/A | N/A |  |" in lines
+        assert (
+            "| 3 | Naive Last Value | Baseline | 55.00 | 65.00 | -0.2500 | 50.00 | 60.00 | -0.5000 | NEGATIVE_R2 |"
+            in lines
+        )
+        assert "**Warning:** 1 model(s) have negative R² scores (marked with ⚠️)" in lines
+        assert '  default_model: "Gradient Boosting"' in lines
+        assert lines[-1] == "*This report was automatically generated by the Expense Predictor system.*"
@@ -4,15 +4,28 @@ Unit tests for config.py module.
 This module tests configuration loading and validation.
 """
 
+import json
 import os
 import tempfile
+from collections.abc import Mapping
 from unittest.mock import mock_open, patch
 
 import pytest
 import yaml
+from pydantic import ValidationError
 
 # Import functions to test
-from config import DEFAULT_CONFIG, _merge_configs, get_config, load_config
+from config import (
+    DEFAULT_CONFIG,
+    Config,
+    RandomForestConfig,
+    _format_validation_error,
+    _freeze_config,
+    copy_config,
+    get_config,
+    load_config,
+    reload_config,
+)
 from exceptions import ConfigurationError
 
 
@@ -117,8 +130,8 @@ class TestLoadConfig:
         try:
             monkeypatch.setattr("config.CONFIG_FILE", temp_file)
 
-            # Mock yaml.safe_load to raise an unexpected exception
-            with patch("yaml.safe_load", side_effect=RuntimeError("Unexpected error")):
+            # Mock yaml.load to raise an unexpected exception
+            with patch("yaml.load", side_effect=RuntimeError("Unexpected error")):
                 with pytest.raises(ConfigurationError) as exc_info:
                     load_config()
 
@@ -131,54 +144,145 @@ class TestLoadConfig:
 
 
 @pytest.mark.unit
-class TestMergeConfigs:
-    """Tests for _merge_configs function."""
-
-    def test_merge_with_none(self):
-        """Test merging when custom config is None."""
-        default = {"key": "value"}
-        result = _merge_configs(default, None)
-        assert result == default
-
-    def test_merge_shallow_dict(self):
-        """Test merging shallow dictionaries."""
-        default = {"a": 1, "b": 2}
-        custom = {"b": 3, "c": 4}
-        result = _merge_configs(default, custom)
-
-        assert result["a"] == 1
-        assert result["b"] == 3
-        assert result["c"] == 4
-
-    def test_merge_nested_dict(self):
-        """Test merging nested dictionaries."""
-        default = {"section1": {"param1": 10, "param2": 20}, "section2": {"param3": 30}}
-        custom = {"section1": {"param1": 100}}  # Override one param
-        result = _merge_configs(default, custom)
-
-        assert result["section1"]["param1"] == 100
-        assert result["section1"]["param2"] == 20  # Kept from default
-        assert result["section2"]["param3"] == 30
-
-    def test_merge_preserves_default(self):
-        """Test that merging doesn't modify original default."""
-        default = {"key": {"nested": 1}}
-        custom = {"key": {"nested": 2}}
-        result = _merge_configs(default, custom)
-
-        # Original should be unchanged
-        assert default["key"]["nested"] == 1
-        assert result["key"]["nested"] == 2
+class TestConfigCache:
+    """Tests for the (path, mtime, size) keyed configuration cache."""
+
+    def test_unchanged_file_is_not_reparsed(self, monkeypatch):
+        """Test that a second load of an unchanged file reuses the cached result."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+            yaml.dump({"data_processing": {"skiprows": 20}}, f)
+            temp_file = f.name
+
+        try:
+            monkeypatch.setattr("config.CONFIG_FILE", temp_file)
+            first = load_config()
+
+            with patch("yaml.load", side_effect=AssertionError("config.yaml was parsed again")):
+                second = load_config()
+
+            assert second is first
+        finally:
+            os.remove(temp_file)
+
+    def test_modified_file_is_reloaded(self, monkeypatch):
+        """Test that changing the file invalidates the cached result."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+            yaml.dump({"data_processing": {"skiprows": 20}}, f)
+            temp_file = f.name
+
+        try:
+            monkeypatch.setattr("config.CONFIG_FILE", temp_file)
+            assert load_config()["data_processing"]["skiprows"] == 20
+
+            with open(temp_file, "w") as f:
+                yaml.dump({"data_processing": {"skiprows": 150}}, f)
+
+            assert load_config()["data_processing"]["skiprows"] == 150
+        finally:
+            os.remove(temp_file)
+
+    def test_reload_config_forces_a_fresh_load(self, monkeypatch):
+        """Test that reload_config re-reads the file even when the cache key is unchanged."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+            yaml.dump({"data_processing": {"skiprows": 20}}, f)
+            temp_file = f.name
+
+        try:
+            monkeypatch.setattr("config.CONFIG_FILE", temp_file)
+            first = load_config()
+
+            second = reload_config()
+
+            assert second is not first
+            assert second == first
+        finally:
+            os.remove(temp_file)
+
+
+@pytest.mark.unit
+class TestPersistedConfigCache:
+    """Tests for the opt-in JSON configuration cache."""
+
+    def test_cache_disabled_by_default(self, monkeypatch):
+        """Test that no cache file is written unless the environment variable is set."""
+        monkeypatch.delenv("EXPENSE_PREDICTOR_CONFIG_CACHE", raising=False)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = os.path.join(temp_dir, "config.yaml")
+            with open(config_path, "w") as f:
+                yaml.dump({"data_processing": {"skiprows": 20}}, f)
+
+            monkeypatch.setattr("config.CONFIG_FILE", config_path)
+            load_config()
+
+            assert not os.path.exists(config_path + ".cache.json")
+
+    def test_cache_reused_without_parsing_yaml(self, monkeypatch):
+        """Test that a fresh process state loads the configuration from the JSON cache."""
+        monkeypatch.setenv("EXPENSE_PREDICTOR_CONFIG_CACHE", "true")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = os.path.join(temp_dir, "config.yaml")
+            with open(config_path, "w") as f:
+                yaml.dump({"data_processing": {"skiprows": 20}}, f)
+
+            monkeypatch.setattr("config.CONFIG_FILE", config_path)
+            first = load_config()
+            assert os.path.exists(config_path + ".cache.json")
+
+            # Simulate a new process by discarding the in-memory cache
+            with patch("yaml.load", side_effect=AssertionError("config.yaml was parsed again")):
+                second = reload_config()
+
+            assert second == first
+            assert second["data_processing"]["skiprows"] == 20
+
+    def test_corrupt_cache_is_ignored(self, monkeypatch):
+        """Test that an unreadable JSON cache falls back to parsing config.yaml."""
+        monkeypatch.setenv("EXPENSE_PREDICTOR_CONFIG_CACHE", "true")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = os.path.join(temp_dir, "config.yaml")
+            with open(config_path, "w") as f:
+                yaml.dump({"data_processing": {"skiprows": 20}}, f)
+            with open(config_path + ".cache.json", "w") as f:
+                f.write("{not json")
+
+            monkeypatch.setattr("config.CONFIG_FILE", config_path)
+
+            assert load_config()["data_processing"]["skiprows"] == 20
+
+    def test_stale_cache_is_ignored(self, monkeypatch):
+        """Test that editing config.yaml invalidates the JSON cache."""
+        monkeypatch.setenv("EXPENSE_PREDICTOR_CONFIG_CACHE", "true")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = os.path.join(temp_dir, "config.yaml")
+            with open(config_path, "w") as f:
+                yaml.dump({"data_processing": {"skiprows": 20}}, f)
+
+            monkeypatch.setattr("config.CONFIG_FILE", config_path)
+            load_config()
+
+            with open(config_path, "w") as f:
+                yaml.dump({"data_processing": {"skiprows": 150}}, f)
+
+            assert reload_config()["data_processing"]["skiprows"] == 150
 
 
 @pytest.mark.unit
 class TestGetConfig:
     """Tests for get_config function."""
 
-    def test_get_config_returns_dict(self):
-        """Test that get_config returns a dictionary."""
+    def test_get_config_returns_mapping(self):
+        """Test that get_config returns a mapping."""
+        result = get_config()
+        assert isinstance(result, Mapping)
+
+    def test_get_config_is_read_only(self):
+        """Test that the shared configuration cannot be mutated by callers."""
         result = get_config()
-        assert isinstance(result, dict)
+
+        with pytest.raises(TypeError):
+            result["data_processing"] = {}
+        with pytest.raises(TypeError):
+            result["data_processing"]["skiprows"] = 0
 
     def test_get_config_has_required_sections(self):
         """Test that config has all required sections."""
@@ -197,6 +301,31 @@ class TestGetConfig:
             assert section in result
 
 
+@pytest.mark.unit
+class TestLazyModuleConfig:
+    """Tests for the lazily loaded module-level config attribute."""
+
+    def test_config_loaded_on_first_access(self, monkeypatch):
+        """Test that the module-level config is loaded on first access and then reused."""
+        import config as config_module
+
+        monkeypatch.delitem(vars(config_module), "config", raising=False)
+        loaded = {"logging": {"level": "INFO"}}
+        calls = []
+        monkeypatch.setattr("config.load_config", lambda: calls.append(1) or loaded)
+
+        assert config_module.config is loaded
+        assert config_module.config is loaded
+        assert len(calls) == 1
+
+    def test_unknown_attribute_raises(self):
+        """Test that other missing attributes still raise AttributeError."""
+        import config as config_module
+
+        with pytest.raises(AttributeError):
+            config_module.not_a_setting
+
+
 @pytest.mark.unit
 class TestDefaultConfig:
     """Tests for DEFAULT_CONFIG constant."""
@@ -210,6 +339,34 @@ class TestDefaultConfig:
         assert "gradient_boosting" in DEFAULT_CONFIG
         assert "tuning" in DEFAULT_CONFIG
 
+    def test_default_config_matches_model_defaults(self):
+        """Test the defaults fallback matches the validated result of an empty config."""
+        assert _freeze_config(Config().model_dump()) == DEFAULT_CONFIG
+
+    def test_default_config_is_read_only(self):
+        """Test DEFAULT_CONFIG cannot be mutated by callers that receive it as a fallback."""
+        with pytest.raises(TypeError):
+            DEFAULT_CONFIG["data_processing"]["skiprows"] = 0
+
+    def test_default_config_lists_are_read_only(self):
+        """Test list settings are frozen too, so in-place edits cannot leak into later callers."""
+        lags = DEFAULT_CONFIG["feature_engineering"]["lags"]
+        assert isinstance(lags, tuple)
+        with pytest.raises(AttributeError):
+            lags.append(99)
+
+    def test_copy_config_returns_mutable_plain_tree(self):
+        """Test copy_config undoes the freeze so the copy can be edited, serialised and validated."""
+        copied = copy_config(DEFAULT_CONFIG)
+        copied["feature_engineering"]["lags"].append(99)
+        copied["data_processing"]["skiprows"] = 0
+
+        assert isinstance(copied["tuning"]["random_forest"]["max_depth"], list)
+        assert json.loads(json.dumps(copied)) == copied
+        assert Config.model_validate(copied).data_processing.skiprows == 0
+        assert 99 not in DEFAULT_CONFIG["feature_engineering"]["lags"]
+        assert DEFAULT_CONFIG["data_processing"]["skiprows"] == 12
+
     def test_default_config_values(self):
         """Test DEFAULT_CONFIG has reasonable default values."""
         assert DEFAULT_CONFIG["data_processing"]["skiprows"] == 12
@@ -479,3 +636,121 @@ class TestConfigValidation:
                 assert result["random_forest"]["max_features"] == value
             finally:
                 os.remove(temp_file)
+
+    def test_max_features_numeric_strings(self):
+        """Test that numeric max_features strings are accepted and malformed ones rejected."""
+        for value in ["3", "0.5", ".5", "-1"]:
+            assert RandomForestConfig(max_features=value).max_features == value
+
+        for value in ["1.2.3", "1-2", "--1", ""]:
+            with pytest.raises(ValidationError):
+                RandomForestConfig(max_features=value)
+
+    def test_invalid_max_features_value(self, monkeypatch):
+        """Test that unknown max_features values are rejected for both tree ensembles."""
+        for section in ["random_forest", "gradient_boosting"]:
+            with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+                yaml.dump({section: {"max_features": "most"}}, f)
+                temp_file = f.name
+
+            try:
+                monkeypatch.setattr("config.CONFIG_FILE", temp_file)
+                with pytest.raises(ConfigurationError) as exc_info:
+                    load_config()
+
+                assert f"{section}.max_features" in str(exc_info.value)
+            finally:
+                os.remove(temp_file)
+
+    def test_invalid_list_elements_report_position(self, monkeypatch):
+        """Test that out-of-range list entries are rejected with the offending index."""
+        cases = [
+            ({"baselines": {"rolling_windows_months": [3, 0]}}, "baselines.rolling_windows_months.1"),
+            ({"tuning": {"random_forest": {"subsample": [1.5]}}}, "tuning.random_forest.subsample.0"),
+            ({"feature_engineering": {"rolling_windows": [7, 1]}}, "feature_engineering.rolling_windows.1"),
+            ({"feature_engineering": {"lags": [-1]}}, "feature_engineering.lags.0"),
+        ]
+        for invalid_config, field_path in cases:
+            with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+                yaml.dump(invalid_config, f)
+                temp_file = f.name
+
+            try:
+                monkeypatch.setattr("config.CONFIG_FILE", temp_file)
+                with pytest.raises(ConfigurationError) as exc_info:
+                    load_config()
+
+                assert field_path in str(exc_info.value)
+            finally:
+                os.remove(temp_file)
+
+    def test_unknown_key_rejected(self, monkeypatch):
+        """Test that misspelled configuration keys raise ConfigurationError."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+            yaml.dump({"random_forest": {"n_estimator": 50}}, f)
+            temp_file = f.name
+
+        try:
+            monkeypatch.setattr("config.CONFIG_FILE", temp_file)
+            with pytest.raises(ConfigurationError) as exc_info:
+                load_config()
+
+            assert "random_forest.n_estimator" in str(exc_info.value)
+        finally:
+            os.remove(temp_file)
+
+    def test_invalid_baselines_rolling_engine(self, monkeypatch):
+        """Test that an unknown rolling engine raises ConfigurationError."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+            invalid_config = {"baselines": {"rolling_engine": "cuda"}}
+            yaml.dump(invalid_config, f)
+            temp_file = f.name
+
+        try:
+            monkeypatch.setattr("config.CONFIG_FILE", temp_file)
+            with pytest.raises(ConfigurationError) as exc_info:
+                load_config()
+
+            assert "baselines.rolling_engine" in str(exc_info.value)
+        finally:
+            os.remove(temp_file)
+
+
+@pytest.mark.unit
+class TestFormatValidationError:
+    """Tests for _format_validation_error message formatting."""
+
+    def test_formats_by_error_type(self):
+        """Test that each handled error type gets its user-friendly message."""
+        literal = {
+            "loc": ("logging", "level"),
+            "type": "literal_error",
+            "msg": "Input should be 'INFO'",
+            "ctx": {"expected": "'INFO'"},
+        }
+        bound = {
+            "loc": ("decision_tree", "max_depth"),
+            "type": "greater_than_equal",
+            "msg": "Input should be greater than or equal to 1",
+        }
+        parsing = {
+            "loc": ("tuning", "top_k_log"),
+            "type": "int_parsing",
+            "msg": "Input should be a valid integer",
+            "input": "five",
+        }
+        other = {"loc": ("random_forest", "n_estimator"), "type": "extra_forbidden", "msg": "Extra inputs are not permitted"}
+
+        assert (
+            _format_validation_error(literal)
+            == "Invalid value for 'logging.level': Input should be 'INFO' Expected one of: 'INFO'"
+        )
+        assert (
+            _format_validation_error(bound)
+            == "Invalid value for 'decision_tree.max_depth': Input should be greater than or equal to 1"
+        )
+        assert _format_validation_error(parsing) == "Invalid type for 'tuning.top_k_log': expected integer, got 'five'"
+        assert (
+            _format_validation_error(other)
+            == "Invalid configuration for 'random_forest.n_estimator': Extra inputs are not permitted"
+        )
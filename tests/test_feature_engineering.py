@@ -14,8 +14,10 @@ import pandas as pd
 import pytest
 
 from feature_engineering import (
+    DAY_OF_WEEK_COLUMNS,
     drop_nan_from_features,
     generate_calendar_features,
+    generate_day_of_week_features,
     generate_lag_features,
     generate_rolling_features,
     generate_timeseries_features,
@@ -75,6 +77,23 @@ class TestLagFeatures:
         r2 = generate_lag_features(daily_df, lags=[1, 3])
         pd.testing.assert_frame_equal(r1, r2)
 
+    def test_matches_shift(self, daily_df):
+        result = generate_lag_features(daily_df, lags=[1, 3, 6])
+        for lag in [1, 3, 6]:
+            expected = daily_df["Tran Amt"].shift(lag).astype(float).rename(f"lag_{lag}")
+            pd.testing.assert_series_equal(result[f"lag_{lag}"], expected)
+
+    def test_lag_longer_than_series(self, daily_df):
+        short = daily_df.head(3)
+        result = generate_lag_features(short, lags=[1, 5])
+        assert result["lag_5"].isna().all()
+        assert result["lag_1"].iloc[1:].notna().all()
+
+    def test_input_not_modified(self, daily_df):
+        columns_before = list(daily_df.columns)
+        generate_lag_features(daily_df, lags=[1])
+        assert list(daily_df.columns) == columns_before
+
 
 class TestRollingFeatures:
     """Tests for generate_rolling_features."""
@@ -109,6 +128,35 @@ class TestRollingFeatures:
         r2 = generate_rolling_features(daily_df, windows=[7])
         pd.testing.assert_frame_equal(r1, r2)
 
+    def test_matches_pandas_rolling(self, daily_df):
+        result = generate_rolling_features(daily_df, windows=[3, 7, 30])
+        shifted = daily_df["Tran Amt"].shift(1)
+        for w in [3, 7, 30]:
+            rolling = shifted.rolling(window=w, min_periods=w)
+            np.testing.assert_allclose(result[f"rolling_mean_{w}"], rolling.mean(), rtol=1e-9)
+            np.testing.assert_allclose(result[f"rolling_std_{w}"], rolling.std(), rtol=1e-7, atol=1e-8)
+
+    def test_nan_in_target_propagates_to_window(self, daily_df):
+        df = daily_df.copy()
+        df.loc[10, "Tran Amt"] = np.nan
+        result = generate_rolling_features(df, windows=[3])
+        expected = df["Tran Amt"].shift(1).rolling(window=3, min_periods=3).mean()
+        np.testing.assert_allclose(result["rolling_mean_3"], expected, rtol=1e-9)
+        assert result["rolling_mean_3"].iloc[11:14].isna().all()
+
+    def test_constant_window_has_zero_std(self):
+        df = pd.DataFrame(
+            {"Date": pd.date_range("2024-01-01", periods=10), "Tran Amt": [0.0] * 5 + [50.0] * 5}
+        )
+        result = generate_rolling_features(df, windows=[3])
+        assert result["rolling_std_3"].iloc[3] == 0.0
+        assert result["rolling_std_3"].iloc[9] == pytest.approx(0.0, abs=1e-9)
+
+    def test_window_longer_than_series(self, daily_df):
+        result = generate_rolling_features(daily_df.head(5), windows=[7])
+        assert result["rolling_mean_7"].isna().all()
+        assert result["rolling_std_7"].isna().all()
+
 
 class TestCalendarFeatures:
     """Tests for generate_calendar_features."""
@@ -132,6 +180,53 @@ class TestCalendarFeatures:
         result = generate_calendar_features(dates)
         assert list(result["Year"]) == [2023, 2024]
 
+    def test_compact_dtypes(self, daily_df):
+        result = generate_calendar_features(daily_df)
+        assert result["Quarter"].dtype == np.int8
+        assert result["Year"].dtype == np.int16
+
+    def test_input_not_modified(self, daily_df):
+        before = daily_df.copy()
+        result = generate_calendar_features(daily_df)
+        pd.testing.assert_frame_equal(daily_df, before)
+        assert list(result.columns) == ["Date", "Tran Amt", "Quarter", "Year"]
+
+
+class TestDayOfWeekFeatures:
+    """Tests for generate_day_of_week_features."""
+
+    def test_matches_get_dummies(self, daily_df):
+        result = generate_day_of_week_features(daily_df)
+        expected = pd.get_dummies(
+            daily_df["Date"].dt.day_name().rename("Day of the Week"), drop_first=True
+        ).add_prefix("Day of the Week_")
+        pd.testing.assert_frame_equal(result[list(DAY_OF_WEEK_COLUMNS)], expected)
+        assert list(result.columns) == ["Date", "Tran Amt", *DAY_OF_WEEK_COLUMNS]
+
+    def test_single_day_is_encoded(self):
+        # A lone Monday must set the Monday column, not collapse to the
+        # reference day as get_dummies(drop_first=True) would.
+        df = pd.DataFrame({"Date": pd.to_datetime(["2024-01-01"])})
+        result = generate_day_of_week_features(df)
+        assert list(result.columns[1:]) == list(DAY_OF_WEEK_COLUMNS)
+        assert result["Day of the Week_Monday"].iloc[0]
+        assert result[list(DAY_OF_WEEK_COLUMNS)].sum(axis=1).iloc[0] == 1
+
+    def test_friday_is_reference_day(self):
+        df = pd.DataFrame({"Date": pd.to_datetime(["2024-01-05"])})
+        result = generate_day_of_week_features(df)
+        assert not result[list(DAY_OF_WEEK_COLUMNS)].any(axis=1).iloc[0]
+
+    def test_ordinal_encoding(self, daily_df):
+        result = generate_day_of_week_features(daily_df, encoding="ordinal")
+        assert list(result.columns) == ["Date", "Tran Amt", "Day of the Week"]
+        assert result["Day of the Week"].dtype == np.int8
+        assert (result["Day of the Week"] == daily_df["Date"].dt.dayofweek).all()
+
+    def test_unknown_encoding_raises(self, daily_df):
+        with pytest.raises(ValueError, match="Unsupported day-of-week encoding"):
+            generate_day_of_week_features(daily_df, encoding="binary")
+
 
 class TestDropNanFromFeatures:
     """Tests for drop_nan_from_features."""
@@ -152,6 +247,38 @@ class TestDropNanFromFeatures:
         result = drop_nan_from_features(df, logger=mock_logger)
         assert len(result) == 2
 
+    def test_max_lookback_slices_leading_rows(self, mock_logger):
+        df = pd.DataFrame({"a": [np.nan, np.nan, 1.0, 2.0], "b": [1.0, 2.0, 3.0, 4.0]})
+        result = drop_nan_from_features(df, logger=mock_logger, max_lookback=2)
+        pd.testing.assert_frame_equal(result, df.dropna().reset_index(drop=True))
+        mock_logger.info.assert_called_once()
+
+    def test_lookback_matches_dropna_for_generated_features(self, daily_df, mock_logger):
+        ts_config = {"lags": [1, 12], "rolling_windows": [7, 14], "calendar": True}
+        result = generate_timeseries_features(daily_df, ts_config, logger=mock_logger)
+        full = generate_timeseries_features(daily_df, ts_config, logger=mock_logger, drop_na=False)
+        pd.testing.assert_frame_equal(result, full.dropna().reset_index(drop=True))
+        assert len(result) == len(daily_df) - 14
+
+    def test_nan_target_falls_back_to_dropna(self, daily_df, mock_logger):
+        df = daily_df.copy()
+        df.loc[40, "Tran Amt"] = np.nan
+        ts_config = {"lags": [1], "rolling_windows": [], "calendar": False}
+        result = generate_timeseries_features(df, ts_config, logger=mock_logger)
+        assert not result.isna().any().any()
+        assert len(result) == len(df) - 3
+
+    @pytest.mark.parametrize("lags", [[], [1, 3]])
+    def test_nan_in_other_column_falls_back_to_dropna(self, daily_df, mock_logger, lags):
+        df = daily_df.copy()
+        df["Note"] = 1.0
+        df.loc[40, "Note"] = np.nan
+        ts_config = {"lags": lags, "rolling_windows": [], "calendar": False}
+        result = generate_timeseries_features(df, ts_config, logger=mock_logger)
+        full = generate_timeseries_features(df, ts_config, logger=mock_logger, drop_na=False)
+        pd.testing.assert_frame_equal(result, full.dropna().reset_index(drop=True))
+        assert len(result) == len(df) - max(lags, default=0) - 1
+
 
 class TestSaveFeatureList:
     """Tests for save_feature_list."""
@@ -166,6 +293,25 @@ class TestSaveFeatureList:
             assert data["feature_count"] == 3
             assert data["features"] == ["a", "b", "c"]
 
+    def test_output_matches_json_dump_format(self, mock_logger):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "features.json")
+            save_feature_list(["lag_1", "Day of the Week_Monday"], path, logger=mock_logger)
+
+            with open(path) as f:
+                content = f.read()
+            expected = {"feature_count": 2, "features": ["lag_1", "Day of the Week_Monday"]}
+            assert content == json.dumps(expected, indent=2)
+
+    def test_non_ascii_names_written_as_utf8(self, mock_logger):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "features.json")
+            save_feature_list(["Montant (€)"], path, logger=mock_logger)
+
+            with open(path, encoding="utf-8") as f:
+                content = f.read()
+            assert content == json.dumps({"feature_count": 1, "features": ["Montant (€)"]}, indent=2, ensure_ascii=False)
+
     def test_creates_directories(self, mock_logger):
         with tempfile.TemporaryDirectory() as tmpdir:
             path = os.path.join(tmpdir, "sub", "dir", "features.json")
@@ -202,6 +348,14 @@ class TestGenerateTimeseriesFeatures:
         r2 = generate_timeseries_features(daily_df.copy(), ts_config, logger=mock_logger)
         pd.testing.assert_frame_equal(r1, r2)
 
+    def test_matches_individual_generators(self, daily_df, mock_logger):
+        ts_config = {"lags": [1, 6], "rolling_windows": [7, 14], "calendar": True}
+        result = generate_timeseries_features(daily_df, ts_config, logger=mock_logger, drop_na=False)
+        expected = generate_calendar_features(
+            generate_rolling_features(generate_lag_features(daily_df, lags=[1, 6]), windows=[7, 14])
+        )
+        pd.testing.assert_frame_equal(result, expected)
+
     def test_fewer_rows_after_nan_removal(self, daily_df, mock_logger):
         ts_config = {"lags": [1], "rolling_windows": [10], "calendar": True}
         result = generate_timeseries_features(daily_df, ts_config, logger=mock_logger)
@@ -272,6 +426,31 @@ class TestPrepareFutureTimeseriesFeatures:
         assert "Quarter" in result.columns
         assert result["Quarter"].iloc[0] == 2
 
+    def test_matches_features_of_combined_frame(self, daily_df, mock_logger):
+        """Future rows equal the frame-based features computed on history + future."""
+        ts_config = {"lags": [1, 3, 12], "rolling_windows": [7, 30], "calendar": True}
+        future_df = pd.DataFrame({"Date": pd.date_range("2024-03-01", periods=5, freq="D")})
+        result = prepare_future_timeseries_features(daily_df, future_df, ts_config, logger=mock_logger)
+
+        combined = pd.concat(
+            [daily_df[["Date", "Tran Amt"]], future_df.assign(**{"Tran Amt": 0.0})],
+            ignore_index=True,
+        )
+        combined = generate_lag_features(combined, lags=ts_config["lags"])
+        combined = generate_rolling_features(combined, windows=ts_config["rolling_windows"])
+        combined = generate_calendar_features(combined)
+        expected = combined.tail(len(future_df)).drop(columns=["Tran Amt"]).reset_index(drop=True)
+        pd.testing.assert_frame_equal(result, expected, check_exact=False, rtol=1e-9)
+
+    def test_short_history_fills_zero(self, daily_df, mock_logger):
+        ts_config = {"lags": [1, 12], "rolling_windows": [7], "calendar": False}
+        future_df = pd.DataFrame({"Date": pd.date_range("2024-01-04", periods=2, freq="D")})
+        result = prepare_future_timeseries_features(daily_df.head(3), future_df, ts_config, logger=mock_logger)
+        assert list(result.columns) == ["Date", "lag_1", "lag_12", "rolling_mean_7", "rolling_std_7"]
+        assert result["lag_1"].tolist() == [daily_df["Tran Amt"].iloc[2], 0.0]
+        assert (result[["lag_12", "rolling_mean_7", "rolling_std_7"]] == 0.0).all().all()
+        mock_logger.info.assert_called()
+
 
 class TestEmptyFeatureConfig:
     """Tests that empty lag/window lists are handled gracefully."""
@@ -303,3 +482,12 @@ class TestEmptyFeatureConfig:
         from config import FeatureEngineeringConfig
         cfg = FeatureEngineeringConfig(lags=[1], rolling_windows=[])
         assert cfg.rolling_windows == []
+
+    def test_pydantic_day_of_week_encoding(self):
+        from pydantic import ValidationError
+
+        from config import FeatureEngineeringConfig
+        assert FeatureEngineeringConfig().day_of_week_encoding == "onehot"
+        assert FeatureEngineeringConfig(day_of_week_encoding="ordinal").day_of_week_encoding == "ordinal"
+        with pytest.raises(ValidationError):
+            FeatureEngineeringConfig(day_of_week_encoding="binary")
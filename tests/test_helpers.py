@@ -16,13 +16,16 @@ import pandas as pd
 import pytest
 from pandas.tseries.offsets import DateOffset
 
+from constants import DAY_OF_WEEK
 from exceptions import DataValidationError
 
 # Import functions to test
 from helpers import (
-    DAY_OF_WEEK,
     TRANSACTION_AMOUNT_LABEL,
     VALUE_DATE_LABEL,
+    _fill_missing_dates,
+    _parse_dayfirst_dates,
+    _read_transactions_csv,
     chronological_train_test_split,
     find_column_name,
     get_quarter_end_date,
@@ -258,6 +261,11 @@ class TestValidateDateRange:
         # This should pass validation (NaT is ignored in min/max)
         validate_date_range(df, logger=mock_logger)
 
+    def test_validate_date_range_returns_bounds(self, mock_logger):
+        """Test that the earliest and latest dates are returned."""
+        df = pd.DataFrame({"Date": pd.to_datetime(["2024-01-03", "2024-01-01", "2024-01-02"])})
+        assert validate_date_range(df, logger=mock_logger) == (pd.Timestamp("2024-01-01"), pd.Timestamp("2024-01-03"))
+
 
 @pytest.mark.unit
 @pytest.mark.validation
@@ -379,6 +387,17 @@ class TestGetQuarterEndDate:
         expected = datetime(2023, 12, 31)
         assert result == expected
 
+    def test_get_quarter_end_matches_offsets_for_every_day(self):
+        """Test the lookup against month-offset arithmetic across a leap year."""
+        for day in pd.date_range("2024-01-01", "2024-12-31"):
+            quarter_start = datetime(day.year, 3 * ((day.month - 1) // 3 + 1), 1)
+            expected = quarter_start + DateOffset(months=1) - DateOffset(days=1)
+            assert get_quarter_end_date(day.to_pydatetime()) == expected
+
+    def test_get_quarter_end_returns_datetime(self):
+        """Test that a plain datetime is returned."""
+        assert type(get_quarter_end_date(datetime(2024, 5, 15))) is datetime
+
 
 @pytest.mark.unit
 @pytest.mark.validation
@@ -411,6 +430,15 @@ class TestGetTrainingDateRange:
         assert isinstance(result, pd.DatetimeIndex)
         assert result[0] == df["CustomDate"].min()
 
+    def test_get_training_date_range_known_start_date(self, sample_dataframe, mock_logger):
+        """Test that a supplied start date is used without scanning the column."""
+        start_date = sample_dataframe["Date"].min()
+        expected = get_training_date_range(sample_dataframe, logger=mock_logger)
+
+        result = get_training_date_range(sample_dataframe.drop(columns="Date"), logger=mock_logger, start_date=start_date)
+
+        pd.testing.assert_index_equal(result, expected)
+
     def test_get_training_date_range_without_logger(self, sample_dataframe):
         """Test getting date range without logger."""
         result = get_training_date_range(sample_dataframe)
@@ -480,6 +508,97 @@ class TestGetTrainingDateRange:
         assert result[-1] == yesterday
 
 
+@pytest.mark.unit
+class TestFillMissingDates:
+    """Tests for _fill_missing_dates helper."""
+
+    @staticmethod
+    def _reindexed(df, date_range):
+        return (
+            df.set_index("Date")
+            .reindex(date_range)
+            .fillna({TRANSACTION_AMOUNT_LABEL: 0})
+            .reset_index()
+            .rename(columns={"index": "Date"})
+        )
+
+    def test_matches_reindex_and_fillna(self):
+        """Test gaps, NaN amounts, out-of-range dates and extra columns match reindexing."""
+        date_range = pd.date_range("2024-01-01", "2024-01-10")
+        df = pd.DataFrame({
+            "Date": pd.to_datetime(["2024-01-02", "2024-01-05", "2024-01-20"]),
+            TRANSACTION_AMOUNT_LABEL: [10.5, float("nan"), 30.0],
+            "Note": ["a", "b", "c"],
+        })
+        result = _fill_missing_dates(df, date_range)
+        pd.testing.assert_frame_equal(result, self._reindexed(df, date_range))
+        assert result[TRANSACTION_AMOUNT_LABEL].tolist() == [0, 10.5, 0, 0, 0, 0, 0, 0, 0, 0]
+
+    def test_complete_integer_amounts_keep_dtype(self):
+        """Test that a frame already covering the range keeps integer amounts."""
+        date_range = pd.date_range("2024-01-01", periods=5)
+        df = pd.DataFrame({"Date": date_range, TRANSACTION_AMOUNT_LABEL: range(5)})
+        pd.testing.assert_frame_equal(_fill_missing_dates(df, date_range), self._reindexed(df, date_range))
+
+    def test_non_numeric_amounts_preserved(self):
+        """Test that unconverted string amounts pass through for later validation."""
+        date_range = pd.date_range("2024-01-01", periods=3)
+        df = pd.DataFrame({"Date": date_range[:2], TRANSACTION_AMOUNT_LABEL: ["12", "abc"]})
+        result = _fill_missing_dates(df, date_range)
+        assert result[TRANSACTION_AMOUNT_LABEL].tolist() == ["12", "abc", 0]
+
+
+@pytest.mark.unit
+class TestParseDayfirstDates:
+    """Tests for _parse_dayfirst_dates helper."""
+
+    @pytest.mark.parametrize(
+        "values",
+        [
+            [None, "05/01/2024", "31/12/2023", "not a date"],
+            ["05-01-2024", "31-12-2023"],
+            ["05/01/24", "31/12/23"],
+            ["2024-01-05", "2023-12-31"],
+        ],
+    )
+    @pytest.mark.filterwarnings("ignore:Could not infer format")
+    @pytest.mark.filterwarnings("ignore:Parsing dates in")
+    def test_matches_dayfirst_inference(self, values):
+        """Test that every date accepted by dayfirst inference is parsed to the same value."""
+        series = pd.Series(values, dtype=object)
+        expected = pd.to_datetime(series, dayfirst=True, errors="coerce")
+        accepted = expected.notna()
+        pd.testing.assert_series_equal(_parse_dayfirst_dates(series)[accepted], expected[accepted])
+
+    def test_two_digit_years_use_explicit_format(self, mocker):
+        """Test that short-year statement dates are parsed with an explicit format."""
+        to_datetime_spy = mocker.spy(pd, "to_datetime")
+        result = _parse_dayfirst_dates(pd.Series(["05/01/24", "31/12/23"]))
+        assert result.tolist() == [pd.Timestamp("2024-01-05"), pd.Timestamp("2023-12-31")]
+        assert to_datetime_spy.call_args_list[0].kwargs["format"] == "%d/%m/%y"
+
+    def test_padded_values_are_stripped(self):
+        """Test that surrounding whitespace does not defeat the explicit format."""
+        result = _parse_dayfirst_dates(pd.Series(["05/01/24 ", "06/01/24"], dtype=object))
+        assert result.tolist() == [pd.Timestamp("2024-01-05"), pd.Timestamp("2024-01-06")]
+
+    def test_mixed_year_lengths_are_reparsed(self):
+        """Test that values not matching the guessed format fall back to dayfirst inference."""
+        result = _parse_dayfirst_dates(pd.Series(["05/01/24", "06/01/2024"], dtype=object))
+        assert result.tolist() == [pd.Timestamp("2024-01-05"), pd.Timestamp("2024-01-06")]
+
+    def test_datetime_column_returned_unchanged(self):
+        """Test that an already-parsed column is passed through as is."""
+        series = pd.Series(pd.date_range("2024-01-01", periods=3))
+        assert _parse_dayfirst_dates(series) is series
+
+    def test_mixed_datetime_objects_fall_back(self):
+        """Test that non-string values fall back to dayfirst inference."""
+        series = pd.Series([datetime(2024, 1, 5), "06/01/2024"], dtype=object)
+        result = _parse_dayfirst_dates(series)
+        assert result.tolist() == [pd.Timestamp("2024-01-05"), pd.Timestamp("2024-01-06")]
+
+
 @pytest.mark.integration
 class TestPreprocessData:
     """Tests for preprocess_data function."""
@@ -518,6 +637,53 @@ class TestPreprocessData:
         with pytest.raises(DataValidationError):
             preprocess_data("/nonexistent/file.csv", logger=mock_logger)
 
+    def test_read_transactions_csv_parses_types(self, sample_csv_path, mock_logger):
+        """Test that DD/MM/YYYY dates and amounts are parsed while reading."""
+        df = _read_transactions_csv(sample_csv_path, logger=mock_logger)
+        assert pd.api.types.is_datetime64_any_dtype(df["Date"])
+        assert df[TRANSACTION_AMOUNT_LABEL].dtype == "float64"
+        assert df["Date"].iloc[0] == pd.Timestamp("2024-01-01")
+
+    def test_read_transactions_csv_other_date_format(self, temp_dir, mock_logger):
+        """Test that dates in another format are left for dayfirst parsing."""
+        csv_path = os.path.join(temp_dir, "iso.csv")
+        with open(csv_path, "w") as f:
+            f.write("Date,Tran Amt\n2024-01-05,10\n")
+        df = _read_transactions_csv(csv_path, logger=mock_logger)
+        assert df["Date"].tolist() == ["2024-01-05"]
+
+    def test_read_transactions_csv_ignores_extra_columns(self, temp_dir, mock_logger):
+        """Test that only the Date and amount columns are loaded."""
+        csv_path = os.path.join(temp_dir, "extra.csv")
+        with open(csv_path, "w") as f:
+            f.write("Narration,Date,Tran Amt\nRent,01/01/2024,10\n")
+        df = _read_transactions_csv(csv_path, logger=mock_logger)
+        assert df.columns.tolist() == ["Date", TRANSACTION_AMOUNT_LABEL]
+
+    def test_read_transactions_csv_non_numeric_amount(self, temp_dir, mock_logger):
+        """Test that a non-numeric amount raises DataValidationError."""
+        csv_path = os.path.join(temp_dir, "bad.csv")
+        with open(csv_path, "w") as f:
+            f.write("Date,Tran Amt\n01/01/2024,abc\n")
+        with pytest.raises(DataValidationError, match="non-numeric values"):
+            _read_transactions_csv(csv_path, logger=mock_logger)
+
+    def test_read_transactions_csv_malformed(self, temp_dir, mock_logger):
+        """Test that a tokenizing error is reported as a formatting problem."""
+        csv_path = os.path.join(temp_dir, "malformed.csv")
+        with open(csv_path, "w") as f:
+            f.write('Date,Tran Amt\n01/01/2024,"10\n')
+        with pytest.raises(DataValidationError, match="not properly formatted"):
+            _read_transactions_csv(csv_path, logger=mock_logger)
+
+    def test_read_transactions_csv_missing_column(self, temp_dir, mock_logger):
+        """Test that a missing amount column is reported as such."""
+        csv_path = os.path.join(temp_dir, "missing.csv")
+        with open(csv_path, "w") as f:
+            f.write("Date,Amount\n01/01/2024,10\n")
+        with pytest.raises(DataValidationError, match="Missing required columns"):
+            _read_transactions_csv(csv_path, logger=mock_logger)
+
 
 @pytest.mark.unit
 class TestPrepareFutureDates:
@@ -574,11 +740,26 @@ class TestPrepareFutureDates:
         day_columns = [col for col in future_df.columns if "Day of the Week" in col]
         assert len(day_columns) > 0
 
+        assert future_df["Month"].dtype == "int8"
+        assert future_df["Day of the Month"].dtype == "int8"
+
         # Check that Month and Day values are correct
         for idx, date in enumerate(future_dates):
             assert future_df.loc[idx, "Month"] == date.month
             assert future_df.loc[idx, "Day of the Month"] == date.day
 
+    def test_prepare_future_dates_ordinal_day_of_week(self, mocker):
+        """Test that the ordinal encoding yields one integer day-of-week column."""
+        mocker.patch(
+            "helpers.config",
+            {"feature_engineering": {"enabled": False, "day_of_week_encoding": "ordinal"}},
+        )
+        custom_date = (datetime.now() + timedelta(days=7)).strftime("%d-%m-%Y")
+        future_df, future_dates = prepare_future_dates(custom_date)
+
+        assert [col for col in future_df.columns if "Day of the Week" in col] == [DAY_OF_WEEK]
+        assert future_df[DAY_OF_WEEK].tolist() == list(future_dates.dayofweek)
+
 
 @pytest.mark.unit
 class TestWritePredictions:
@@ -642,6 +823,19 @@ class TestWritePredictions:
             # Check that formulas are escaped with single quote
             assert "'=1+1" in content or '"\'=1+1"' in content
 
+    def test_write_predictions_does_not_modify_input(self, temp_dir, mock_logger):
+        """Test that the caller's DataFrame keeps its datetime Date column."""
+        predicted_df = pd.DataFrame(
+            {"Date": pd.date_range(start="2024-01-01", periods=3), "Predicted Tran Amt": [100.0, 150.0, 200.0]}
+        )
+        original = predicted_df.copy()
+        output_path = os.path.join(temp_dir, "predictions.csv")
+
+        write_predictions(predicted_df, output_path, logger=mock_logger, skip_confirmation=True)
+
+        pd.testing.assert_frame_equal(predicted_df, original)
+        assert pd.read_csv(output_path)["Date"].tolist() == ["01/01/2024", "02/01/2024", "03/01/2024"]
+
     def test_write_predictions_without_logger(self, temp_dir):
         """Test writing predictions without logger."""
         predicted_df = pd.DataFrame(
@@ -768,6 +962,18 @@ class TestChronologicalTrainTestSplit:
         with pytest.raises(DataValidationError, match="duplicate dates"):
             chronological_train_test_split(X, y, df, test_size=0.25, logger=mock_logger)
 
+    @pytest.mark.parametrize("nat_position", [0, 1, 2])
+    def test_rejects_missing_dates(self, mock_logger, nat_position):
+        """Test that a NaT anywhere in the dates is reported as out of order."""
+        dates = pd.Series(pd.to_datetime(["2024-01-01", "2024-01-02", "2024-01-03"]))
+        dates[nat_position] = pd.NaT
+        df = pd.DataFrame({"Date": dates, TRANSACTION_AMOUNT_LABEL: [100, 200, 300], "Month": [1, 1, 1]})
+        X = df.drop(["Date", TRANSACTION_AMOUNT_LABEL], axis=1)
+        y = df[TRANSACTION_AMOUNT_LABEL]
+
+        with pytest.raises(DataValidationError, match="not in chronological order"):
+            chronological_train_test_split(X, y, df, test_size=0.3, logger=mock_logger)
+
     def test_different_test_sizes(self, mock_logger):
         """Test split with various test_size values."""
         X, y, df = self._make_chronological_data(100)